@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Collection, Sequence
 
 from threading import RLock
-from typing import Any, Generic, Iterator, Optional, Dict, overload, cast, TYPE_CHECKING, Tuple, TypeVar, Union
+from typing import Any, Final, Generic, Iterator, Optional, Dict, overload, cast, TYPE_CHECKING, Tuple, TypeVar, Union
 from uuid import UUID
 
 from . import BaseElementState
@@ -22,6 +22,12 @@ if TYPE_CHECKING:
     from . import TableElement
 
 
+# element state is held as a plain int; the hottest predicates test these masks directly
+_IS_INVALID: Final = BaseElementState.IS_INVALID_FLAG.value
+_IS_INITIALIZING: Final = BaseElementState.IS_INITIALIZING_FLAG.value
+_IS_DIRTY: Final = BaseElementState.IS_DIRTY_FLAG.value
+
+
 class BaseElement(ABC):
     __slots__: Tuple[str, ...] = ("_state", "_props")
     """
@@ -147,7 +153,7 @@ class BaseElement(ABC):
         """
         Constructs a base element, initializing the flags property to IS_INITIALIZING_FLAG
         """
-        self._state = BaseElementState.IS_INITIALIZING_FLAG
+        self._state: int = _IS_INITIALIZING
         self._props: Dict | None = None
 
     def __repr__(self) -> str:
@@ -177,18 +183,18 @@ class BaseElement(ABC):
     def _mutate_state(self, state: BaseElementState, value: bool) -> None:
         """Protected method used to modify element flags internal state"""
         if bool(value):
-            self._state |= state
+            self._state |= state._value_
         else:
-            self._state &= ~state
+            self._state &= ~state._value_
 
     def _set(self, state: BaseElementState) -> None:
-        self._state |= state
+        self._state |= state._value_
 
     def _reset(self, state: BaseElementState) -> None:
-        self._state &= ~state
+        self._state &= ~state._value_
 
     def _is_set(self, state: BaseElementState) -> bool:
-        return (self._state & state) != BaseElementState.NO_FLAGS_SET
+        return (self._state & state._value_) != 0
 
     def _invalidate(self) -> None:
         self._reset_element_properties()
@@ -350,7 +356,7 @@ class BaseElement(ABC):
 
     @property
     def is_dirty(self) -> bool:
-        return self._is_set(BaseElementState.IS_DIRTY_FLAG)
+        return (self._state & _IS_DIRTY) != 0
 
     def _mark_dirty(self) -> None:
         self._set(BaseElementState.IS_DIRTY_FLAG)
@@ -365,7 +371,7 @@ class BaseElement(ABC):
         a parent element has been deleted
         :return: True if the element has been deleted
         """
-        return self._is_set(BaseElementState.IS_INVALID_FLAG)
+        return (self._state & _IS_INVALID) != 0
 
     @property
     def is_valid(self) -> bool:
@@ -373,7 +379,7 @@ class BaseElement(ABC):
         Returns True if the element has not been deleted
         :return: True if element has not been deleted
         """
-        return not self.is_invalid
+        return (self._state & _IS_INVALID) == 0
 
     @property
     def is_supports_null(self) -> bool:
@@ -401,11 +407,11 @@ class BaseElement(ABC):
 
     @property
     def is_initializing(self) -> bool:
-        return self._is_set(BaseElementState.IS_INITIALIZING_FLAG)
+        return (self._state & _IS_INITIALIZING) != 0
 
     @property
     def is_initialized(self) -> bool:
-        return not self.is_initializing
+        return (self._state & _IS_INITIALIZING) == 0
 
     def _mark_initialized(self) -> None:
         self._reset(BaseElementState.IS_INITIALIZING_FLAG)
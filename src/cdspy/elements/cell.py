@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from typing import Any, Final, cast, Collection, Dict, Iterator, List, Callable, Union
-from typing import Optional, Type, TYPE_CHECKING
+from typing import Optional, Set, Type, TYPE_CHECKING
 from threading import RLock
 import uuid
 
@@ -43,6 +43,9 @@ class Cell(TableElement, Derivable, Groupable):
         "_value",
         "_col",
         "_lock",
+        "_groups",
+        "_affects",
+        "_derivation",
         "__weakref__",
     ]
 
@@ -53,6 +56,10 @@ class Cell(TableElement, Derivable, Groupable):
         self._offset = cell_offset if cell_offset is not None else -1
         self._value = None
         self._lock = RLock()
+        # group membership, affects and derivation are rare, so are only allocated when used
+        self._groups: Optional[Set[Group]] = None
+        self._affects: Optional[Set[Derivable]] = None
+        self._derivation: Optional[Derivation] = None
         self._set(BaseElementState.IS_PERSISTENT_FLAG)
         # initialize special properties
         for p in self.element_type.initializable_properties():
@@ -100,11 +107,17 @@ class Cell(TableElement, Derivable, Groupable):
         if self._col and self._offset >= 0 and self._col._cells[self._offset] == self:
             # noinspection PyTypeChecker
             self._col._cells[self._offset] = cast(Cell, None)
+            row = self._row
+            if row:
+                row._cell_count -= 1
 
         # reset the cell state
         self._value: Any = None
         self._col = None  # type: ignore[assignment]
         self._offset = -1
+        self._groups = None
+        self._affects = None
+        self._derivation = None
 
         # and invalidate, marking it as deleted
         self._reset_element_properties()
@@ -132,14 +145,9 @@ class Cell(TableElement, Derivable, Groupable):
     def get_property(self, key: Union[Property, str, None]) -> Any:
         return super().get_property(key)
 
-    def _reset_element_properties(self) -> None:
-        if self.table:
-            self.table._reset_cell_element_properties(self)
-
     def _element_properties(self, create_if_empty: bool = False) -> Optional[Dict]:
         """
-        Overridden in Cell class, as Property array is maintained in parent table
-        to minimize space consumed by table cells
+        Overridden in Cell class, as properties are only available to cells in a table
         :param create_if_empty:
         :return:
         """
@@ -503,11 +511,11 @@ class Cell(TableElement, Derivable, Groupable):
 
     @property
     def num_groups(self) -> int:
-        return len(self.table._get_cell_groups(self)) if self.table else 0
+        return len(self._groups) if self._groups else 0
 
     @property
     def groups(self) -> Collection[Group]:
-        return tuple(self.table._get_cell_groups(self)) if self.table else ()
+        return tuple(self._groups) if self._groups else ()
 
     def _add_to_group(self, g: Group) -> None:
         if self.table:
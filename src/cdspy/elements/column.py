@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Collection, Iterator
-from typing import cast, Optional, TYPE_CHECKING
+from typing import cast, Final, Optional, TYPE_CHECKING
 from weakref import ref
 
 from ..utils import ArrayList
@@ -56,18 +56,23 @@ class _ColumnCellIterator:
 
 # noinspection DuplicatedCode_
 class Column(TableSliceElement):
+    element_type: Final = ElementType.Column
+    slices_type: Final = ElementType.Row
+
     def __init__(self, te: Table, proxy: Optional[Column] = None) -> None:
-        from .filters import FilteredColumn
-        from .filters import FilteredTable
+        # if parent column is specified, te must be a FilteredTable; plain columns never need the filters package
+        if proxy:
+            from .filters import FilteredColumn
+            from .filters import FilteredTable
 
-        # if parent row is specified, te must be a FilteredTable
-        if proxy and te and not isinstance(te, FilteredTable):
-            raise UnsupportedException(self, "FilteredTable Required")
+            if te and not isinstance(te, FilteredTable):
+                raise UnsupportedException(self, "FilteredTable Required")
 
         super().__init__(te)
         self._datatype: type | None = None
         self._proxy: Column | None = proxy
-        self._filters = JustInTimeSet[FilteredColumn]()
+        # most slices are never filtered, so the set is only allocated on the first registration
+        self._filters: Optional[JustInTimeSet[FilteredColumn]] = None
 
         for p in self.element_type.initializable_properties():
             value = self._get_template(te).get_property(p)
@@ -80,8 +85,6 @@ class Column(TableSliceElement):
             proxy.register_filter(self)
 
     def _delete(self, compress: bool = True) -> None:
-        from .filters import FilteredColumn
-
         if self.is_invalid:
             return
         try:
@@ -89,17 +92,19 @@ class Column(TableSliceElement):
         except BlockedRequestException:
             return
 
-        # for filter rows, deregister from parent
-        if self._proxy and isinstance(self, FilteredColumn):
-            self._proxy.deregister_filter(self)
+        # for filter columns, deregister from parent
+        if self._proxy:
+            from .filters import FilteredColumn
 
-        # delete all filter columns based on this (self)
-        while self._filters:
-            fr = self._filters.pop()
-            fr.delete()
+            if isinstance(self, FilteredColumn):
+                self._proxy.deregister_filter(self)
 
-        # for good measure
-        self._filters.clear()
+        # delete all filter columns based on this (self)
+        if self._filters:
+            filters = list(self._filters)
+            self._filters.clear()
+            for fr in filters:
+                fr.delete()
 
         # clean up remote handlers
         if self._remote_uuids:
@@ -134,10 +139,7 @@ class Column(TableSliceElement):
                     self.table._columns.__delitem__(index)
 
                     # and reindex remaining columns
-                    if index < self.table.num_columns:
-                        for c in self.table._columns[index:]:
-                            if c:
-                                c._set_index(c.index - 1)
+                    self._reindex_slice(self.table._columns, index)
 
                     # clear element from current cell stack
                     self.table._purge_current_stack(self)
@@ -161,10 +163,13 @@ class Column(TableSliceElement):
         return self.__cells
 
     def register_filter(self, filter_col: FilteredColumn) -> None:
+        if self._filters is None:
+            self._filters = JustInTimeSet()
         self._filters.add(filter_col)
 
     def deregister_filter(self, filter_col: FilteredColumn) -> None:
-        self._filters.discard(filter_col)
+        if self._filters is not None:
+            self._filters.discard(filter_col)
 
     def _reclaim_cell_space(self, rows: ArrayList[Row], num_rows: int) -> None:
         if 0 < num_rows < self._num_cells and self._num_cells:
@@ -183,18 +188,10 @@ class Column(TableSliceElement):
                 capacity_increment=self.table.row_capacity_incr if self.table else None  # type: ignore[arg-type]
             )
 
-    @property
-    def element_type(self) -> ElementType:
-        return ElementType.Column
-
     @property
     def num_slices(self) -> int:
         return self.table.num_rows if self.table else 0
 
-    @property
-    def slices_type(self) -> ElementType:
-        return ElementType.Row
-
     @property
     def capacity(self) -> int:
         """
@@ -260,6 +257,7 @@ class Column(TableSliceElement):
         return c
 
     def _create_new_cell(self, row: Row) -> Cell:
+        row._cell_count += 1
         return Cell(self, row._cell_offset)
 
     @property
@@ -272,11 +270,12 @@ class Column(TableSliceElement):
         return len(self.__cells)
 
     def _invalidate_cell(self, cell_offset: int) -> None:
-        if self.__cells is not None and cell_offset < self._num_cells:
-            cell = self.__cells[cell_offset]
-            if cell:
+        cells = self.__cells
+        if cells is not None and cell_offset < len(cells):
+            cell = cells[cell_offset]
+            if cell is not None:
                 cell._invalidate_cell()
-            self.__cells[cell_offset] = cast(Cell, None)
+                cells[cell_offset] = cast(Cell, None)
 
     @property
     def is_label_indexed(self) -> bool:
@@ -3,16 +3,19 @@ ElementType enum defines all components available in the cdsPy
 """
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, Tuple, Union, Dict
+from typing import cast, Mapping, Optional, TYPE_CHECKING, Tuple, Union, FrozenSet
 
-from enum import Enum, Flag, verify, UNIQUE
+from enum import Enum, IntFlag, verify, UNIQUE
+from functools import cache, total_ordering
+from types import MappingProxyType
 
 if TYPE_CHECKING:
     from . import TableElement
+    from .base_element import BaseElement
 
 
 @verify(UNIQUE)
-class BaseElementState(Flag):
+class BaseElementState(IntFlag):
     NO_FLAGS_SET = 0x0
     ENFORCE_DATATYPE_FLAG = 0x01
     READONLY_FLAG = 0x02
@@ -65,37 +68,32 @@ class ElementType(Enum):
     Derivation = 7
     """An algebraic formula used to calculate a cell value"""
 
-    @property
-    def nickname(self) -> str:
-        if self == ElementType.Column:
-            return "Col"
-        else:
-            return self.name
+    _nickname: str
 
-    def properties(self) -> set[Property]:
-        return {p for p in Property if p.is_implemented_by(self)}
+    def __init__(self, value: int) -> None:
+        self._nickname = "Col" if self._name_ == "Column" else self._name_
 
-    def required_properties(self) -> set[Property]:
-        return {p for p in Property if p.is_required_property and p.is_implemented_by(self)}
+    @property
+    def nickname(self) -> str:
+        return self._nickname
 
-    def optional_properties(self) -> set[Property]:
-        return {p for p in Property if not p.is_required_property and p.is_implemented_by(self)}
+    def properties(self) -> Tuple[Property, ...]:
+        return _properties_by_element_type()[self]
 
-    def initializable_properties(self) -> set[Property]:
-        s = _INITIALIZABLE_PROPERTIES.get(self, None)
-        if s is None:
-            s = {p for p in Property if p.is_initializable_property and self in p.value._implemented_by}
-            _INITIALIZABLE_PROPERTIES[self] = s
-        return s
+    def required_properties(self) -> Tuple[Property, ...]:
+        return _properties_by_element_type("is_required_property")[self]
 
-    def read_only_properties(self) -> set[Property]:
-        return {p for p in Property if p.is_read_only_property and p.is_implemented_by(self)}
+    def optional_properties(self) -> Tuple[Property, ...]:
+        return _properties_by_element_type("is_optional_property")[self]
 
-    def mutable_properties(self) -> set[Property]:
-        return {p for p in Property if p.is_mutable_property and p.is_implemented_by(self)}
+    def initializable_properties(self) -> Tuple[Property, ...]:
+        return _properties_by_element_type("is_initializable_property")[self]
 
+    def read_only_properties(self) -> Tuple[Property, ...]:
+        return _properties_by_element_type("is_read_only_property")[self]
 
-_INITIALIZABLE_PROPERTIES: Dict[ElementType, set[Property]] = {}
+    def mutable_properties(self) -> Tuple[Property, ...]:
+        return _properties_by_element_type("is_mutable_property")[self]
 
 
 class _TablePropertyInfo:
@@ -120,6 +118,10 @@ class _TablePropertyInfo:
         self._nickname = nickname
         self._state = state
         self._implemented_by = set(args) if args else set(ElementType)
+        # bit n is set if the property is implemented by the ElementType with value n
+        self._implemented_by_mask = 0
+        for et in self._implemented_by:
+            self._implemented_by_mask |= 1 << et.value
 
     def __str__(self) -> str:
         optional = "optional" if self._optional else "required"
@@ -129,12 +131,25 @@ class _TablePropertyInfo:
 
 # noinspection PyPropertyDefinition
 @verify(UNIQUE)
+@total_ordering
 class Property(Enum):
     """
     CdsPy defines a number of characteristics, defined in this Property class,
     to control, define, and express ...
     """
 
+    # Property characteristics never change, so they are computed once for
+    # each member, when this module is loaded; see _cache_property_characteristics
+    _hash: int
+    _nickname: str
+    _is_read_only: bool
+    _is_optional: bool
+    _is_initializable: bool
+    _is_state_default: bool
+    _is_boolean: bool
+    _is_numeric: bool
+    _is_string: bool
+
     # Base element properties supported by all table elements
     Label = _TablePropertyInfo(True, False, False, "lb")
     Description = _TablePropertyInfo(True, False, False, "desc")
@@ -352,27 +367,26 @@ class Property(Enum):
             raise ValueError(f"None is not a valid {cls.__name__}")
 
         name = str(name).lower().strip()
-        for member in cls:
-            if member.name.lower() == name:
-                return member
-        raise ValueError(f"'{name}' is not a valid {cls.__name__}")
+        member = _properties_by_lower_name().get(name)
+        if member is None:
+            raise ValueError(f"'{name}' is not a valid {cls.__name__}")
+        return member
 
     @classmethod
     def by_name(cls, name: str) -> Property | None:
-        orig_name = name
         name = name.strip()
-        if name in cls.__members__:
-            return cls[name]
-        # fall back to case-insensitive s
+        member = cls.__members__.get(name)
+        if member is not None:
+            return member
+        # fall back to case-insensitive search
         name = name.lower()
-        for k, v in cls.__members__.items():
-            if k.lower() == name:
-                return v
+        member = _properties_by_lower_name().get(name)
+        if member is not None:
+            return member
+        if name:
+            raise ValueError(f"'{name}' is not a valid {cls.__name__}")
         else:
-            if name:
-                raise ValueError(f"'{name}' is not a valid {cls.__name__}")
-            else:
-                raise ValueError(f"None/Empty is not a valid {cls.__name__}")
+            raise ValueError(f"None/Empty is not a valid {cls.__name__}")
 
     @classmethod  # type: ignore[misc]
     @property
@@ -396,109 +410,145 @@ class Property(Enum):
 
     @staticmethod
     def by_nickname(short_name: Optional[str] = None) -> Optional[Property]:
-        if short_name is None or short_name.strip() is None:
+        if not short_name:
             return None
         short_name = short_name.strip().lower()
-        return _PROPERTIES_BY_NICKNAME[short_name] if short_name in _PROPERTIES_BY_NICKNAME else None
+        return _properties_by_nickname().get(short_name) if short_name else None
+
+    def __init__(self, info: object) -> None:
+        # members are hashed by name; cache it, as Properties are used extensively as dict keys
+        self._hash = hash(self._name_)
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Property):
-            return False
-        return self.name == other.name
+        return self is other
 
     def __lt__(self, other: Property) -> bool:
-        if not isinstance(other, Property):
-            raise NotImplementedError
-        return self.name < other.name
-
-    def __gt__(self, other: Property) -> bool:
-        if not isinstance(other, Property):
+        if type(other) is not Property:
             raise NotImplementedError
-        return self.name > other.name
+        return self._name_ < other._name_
 
     def __hash__(self) -> int:
-        return self.name.__hash__()
+        return self._hash
 
     @property
     def nickname(self) -> str:
-        if self.value._nickname:
-            return str(self.value._nickname)
-        else:
-            return self.name
-
-    def is_implemented_by(self, e: Union[ElementType, TableElement, None]) -> bool:
-        from . import TableElement
+        return self._nickname
 
-        if e is None:
-            return False
-        if isinstance(e, TableElement):
-            return e.element_type in self.value._implemented_by
-        if isinstance(e, ElementType):
-            return e in self.value._implemented_by
-        else:
-            return False  # type: ignore
+    def is_implemented_by(self, e: Union[ElementType, BaseElement, None]) -> bool:
+        if type(e) is not ElementType:
+            # elements, including the TableContext, report their type via element_type
+            e = getattr(e, "element_type", None)
+            if type(e) is not ElementType:
+                return False
+        return bool((self.value._implemented_by_mask >> e.value) & 1)
 
     @property
     def is_read_only_property(self) -> bool:
-        return bool(self.value._read_only)
+        return self._is_read_only
 
     @property
     def is_mutable_property(self) -> bool:
-        return not self.value._read_only
+        return not self._is_read_only
 
     @property
     def is_optional_property(self) -> bool:
-        return bool(self.value._optional)
+        return self._is_optional
 
     @property
     def is_required_property(self) -> bool:
-        return not self.value._optional
+        return not self._is_optional
 
     @property
     def is_initializable_property(self) -> bool:
-        return self.value._initializable
+        return self._is_initializable
 
     @property
     def is_state_default_property(self) -> bool:
-        return self.value._state is not None
+        return self._is_state_default
 
     @property
     def state(self) -> BaseElementState:
-        return self.value._state  # type: ignore[return-value]
+        return cast(BaseElementState, self.value._state)
 
     @property
     def is_boolean_property(self) -> bool:
-        if self.name.lower().startswith("is"):
-            return True
-        # handle one-offs by placing them in set
-        return self in set([])
+        return self._is_boolean
 
     @property
     def is_numeric_property(self) -> bool:
-        if self.name.lower().startswith("num"):
-            return True
-
-        # handle one-offs by placing them in set
-        return self in {
-            Property.Precision,
-            Property.RowCapacityIncr,
-            Property.ColumnCapacityIncr,
-            Property.FreeSpaceThreshold,
-        }
+        return self._is_numeric
 
     @property
     def is_string_property(self) -> bool:
-        # handle one-offs by placing them in set
-        return self in {
-            Property.Label,
-            Property.Description,
-            Property.Units,
-            Property.DisplayFormat,
-        }
+        return self._is_string
+
+
+# Define static property maps; these are built on first use
+@cache
+def _properties_by_nickname() -> Mapping[str, Property]:
+    return MappingProxyType({p._nickname.lower(): p for p in Property})
 
 
-# Define static property maps
-_PROPERTIES_BY_NICKNAME = {p.nickname.lower(): p for p in Property}
+@cache
+def _properties_by_lower_name() -> Mapping[str, Property]:
+    return MappingProxyType({p.name.lower(): p for p in Property})
+
+
+@cache
+def _sorted_properties() -> Tuple[Property, ...]:
+    return tuple(sorted(Property))
+
+
+@cache
+def _properties_by_element_type(predicate: Optional[str] = None) -> Mapping[ElementType, Tuple[Property, ...]]:
+    """
+    Maps each ElementType to the sorted Properties it implements, optionally restricted
+    to those for which the named Property predicate (e.g., "is_required_property") is True
+    """
+    # filter the pre-sorted members in a single pass; order is preserved, so no re-sort is needed
+    props = _sorted_properties()
+    if predicate is not None:
+        props = tuple(p for p in props if getattr(p, predicate))
+    return MappingProxyType({et: tuple(p for p in props if p.is_implemented_by(et)) for et in ElementType})
+
+
+# Properties whose type can't be inferred from their name prefix
+_BOOLEAN_PROPERTIES: FrozenSet[Property] = frozenset()
+_NUMERIC_PROPERTIES: FrozenSet[Property] = frozenset(
+    {
+        Property.Precision,
+        Property.RowCapacityIncr,
+        Property.ColumnCapacityIncr,
+        Property.FreeSpaceThreshold,
+    }
+)
+_STRING_PROPERTIES: FrozenSet[Property] = frozenset(
+    {
+        Property.Label,
+        Property.Description,
+        Property.Units,
+        Property.DisplayFormat,
+    }
+)
+
+
+def _cache_property_characteristics() -> None:
+    for p in Property:
+        info = p.value
+        p._nickname = info._nickname if info._nickname else p.name
+        p._is_read_only = bool(info._read_only)
+        p._is_optional = bool(info._optional)
+        p._is_initializable = bool(info._initializable)
+        p._is_state_default = info._state is not None
+
+        # property types are inferred from name prefixes; one-offs are placed in sets
+        name = p.name.lower()
+        p._is_boolean = name.startswith("is") or p in _BOOLEAN_PROPERTIES
+        p._is_numeric = name.startswith("num") or p in _NUMERIC_PROPERTIES
+        p._is_string = p in _STRING_PROPERTIES
+
+
+_cache_property_characteristics()
 
 
 class _AccessInfo:
@@ -525,6 +575,17 @@ class Access(Enum):
     ByDescription = _AccessInfo(Property.Description)
     ByUUID = _AccessInfo(Property.UUID)
 
+    @classmethod
+    def _missing_(cls, name: object) -> Access:
+        if name is None:
+            raise ValueError(f"None is not a valid {cls.__name__}")
+
+        name = str(name).lower().strip()
+        member = _access_by_lower_name().get(name)
+        if member is None:
+            raise ValueError(f"'{name}' is not a valid {cls.__name__}")
+        return member
+
     @property
     def has_associated_property(self) -> bool:
         return self.value._associated_property is not None
@@ -534,6 +595,11 @@ class Access(Enum):
         return self.value._associated_property  # type: ignore[return-value]
 
 
+@cache
+def _access_by_lower_name() -> Mapping[str, Access]:
+    return MappingProxyType({a.name.lower(): a for a in Access})
+
+
 class _EventTypeInfo:
     """ """
 
@@ -581,7 +647,22 @@ class EventType(Enum):
 
 @verify(UNIQUE)
 class TimeUnit(Enum):
-    MIN = 1.0 / 60.0
-    SEC = 1
-    MSEC = 1000
-    USEC = 1000000
+    MIN = 1
+    SEC = 2
+    MSEC = 3
+    USEC = 4
+
+    @property
+    def seconds(self) -> float:
+        """The number of seconds in one of this unit"""
+        return _SECONDS_PER_TIME_UNIT[self]
+
+
+_SECONDS_PER_TIME_UNIT: Mapping[TimeUnit, float] = MappingProxyType(
+    {
+        TimeUnit.MIN: 60.0,
+        TimeUnit.SEC: 1.0,
+        TimeUnit.MSEC: 1e-3,
+        TimeUnit.USEC: 1e-6,
+    }
+)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, Any, cast
+from typing import Callable, NoReturn, TYPE_CHECKING, Any, cast
 
-from .. import Row, Column, Property
+from .. import BaseElement, Row, Column, Property
 
 from ...exceptions import UnsupportedException, ReadOnlyException
 from ...elements import Cell
@@ -12,6 +12,20 @@ if TYPE_CHECKING:
     from . import FilteredRow, FilteredColumn
 
 
+def _raise_unsupported(message: str) -> Callable[..., NoReturn]:
+    def _raise(self: BaseElement, *args: Any, **kwargs: Any) -> NoReturn:
+        raise UnsupportedException(self, message)
+
+    return _raise
+
+
+def _raise_read_only(p: Property) -> Callable[..., NoReturn]:
+    def _raise(self: BaseElement, *args: Any, **kwargs: Any) -> NoReturn:
+        raise ReadOnlyException(self, p)
+
+    return _raise
+
+
 class FilteredCell(Cell):
     __slots__ = ["_filter_row", "_parent"]
 
@@ -51,11 +65,6 @@ class FilteredCell(Cell):
     def is_write_protected(self) -> bool:
         return True
 
-    def fill(self, o: Any, preprocess: Optional[bool] = True) -> None:
-        raise ReadOnlyException(self, Property.CellValue)
-
-    def clear(self) -> None:
-        raise ReadOnlyException(self, Property.CellValue)
-
-    def delete(self) -> None:
-        raise UnsupportedException(self, "Can not delete a filtered cell")
+    fill = _raise_read_only(Property.CellValue)
+    clear = _raise_read_only(Property.CellValue)
+    delete = _raise_unsupported("Can not delete a filtered cell")
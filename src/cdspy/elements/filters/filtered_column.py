@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, Any, cast
+from typing import Optional, TYPE_CHECKING, cast
 
-from .filtered_cell import FilteredCell
+from .filtered_cell import _raise_unsupported
 from .. import BaseElement, Row, Cell
 from ...exceptions import UnsupportedException
 
@@ -28,7 +28,7 @@ class FilteredColumn(Column):
         if isinstance(row, FilteredRow):
             ftable = cast(FilteredTable, self.table)
             parent_cell = ftable._get_parent_cell(ftable.parent, row.parent, self.parent, create_if_sparse, False)
-            return FilteredCell(row, self, parent_cell)
+            return ftable._get_filtered_cell(row, self, parent_cell)
         else:
             return self.parent._get_cell(row, create_if_sparse, set_to_current)
 
@@ -56,8 +56,5 @@ class FilteredColumn(Column):
     def datatype(self, datatype: type | None) -> None:
         raise UnsupportedException(self, "Can not set the datatype of a filtered Column")
 
-    def fill(self, o: Any, preprocess: Optional[bool] = True) -> None:
-        raise UnsupportedException(self, "Can not fill a filtered Column")
-
-    def clear(self) -> None:
-        raise UnsupportedException(self, "Can not clear a filtered Column")
+    fill = _raise_unsupported("Can not fill a filtered Column")
+    clear = _raise_unsupported("Can not clear a filtered Column")
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Optional, TYPE_CHECKING
 
+from .filtered_cell import _raise_unsupported
 from .. import BaseElement
 from ...exceptions import UnsupportedException
 from ...elements import Row
@@ -11,6 +12,8 @@ if TYPE_CHECKING:
 
 
 class FilteredRow(Row):
+    __slots__ = ["_parent"]
+
     def __init__(self, parent_table: FilteredTable, proxy: Row) -> None:
         super().__init__(parent_table, proxy)
         self._parent = proxy
@@ -35,8 +38,5 @@ class FilteredRow(Row):
     def description(self, value: Optional[str]) -> None:
         raise UnsupportedException(self, "Can not set description of a filtered Row")
 
-    def fill(self, o: Any, preprocess: Optional[bool] = True) -> None:
-        raise UnsupportedException(self, "Can not fill a filtered Row")
-
-    def clear(self) -> None:
-        raise UnsupportedException(self, "Can not clear a filtered Row")
+    fill = _raise_unsupported("Can not fill a filtered Row")
+    clear = _raise_unsupported("Can not clear a filtered Row")
@@ -1,40 +1,40 @@
 from __future__ import annotations
 
-from typing import Optional, cast, TYPE_CHECKING
+from typing import Optional, cast, TYPE_CHECKING, Tuple
+from weakref import WeakValueDictionary
 
-from .. import Table, Group, TableContext, Access
+from .. import Table, Group, TableContext
 
 if TYPE_CHECKING:
     from .. import TableElement, Row, Column, Cell
+    from . import FilteredCell, FilteredColumn, FilteredRow
 
 
 class FilteredTable(Table):
     @classmethod
     def create_table(cls, t: Table, g: Group, tc: Optional[TableContext] = None) -> FilteredTable:
-        tc = t.table_context if tc is None else tc
         return cls(t, g, tc)
 
     def __init__(self, parent: Table, scope: Group, context: Optional[TableContext] = None) -> None:
         from . import FilteredColumn, FilteredRow
 
-        context = parent.table_context if context is None else context
-        super().__init__(parent)
+        super().__init__(parent_context=parent.table_context if context is None else context)
 
         self._parent = parent
+        self._filtered_cells: WeakValueDictionary[Tuple[int, int], FilteredCell] = WeakValueDictionary()
+        self._parent_cells: WeakValueDictionary[Tuple[int, int], Cell] = WeakValueDictionary()
         self.parent._register_filter(self)
 
-        # add the columns and rows defined in the scope
-
-        if scope.num_columns != scope._num_effective_columns:
+        # add the columns and rows defined in the scope; a scope without explicit
+        # columns (or rows) but with rows (or columns) spans all those of the parent
+        num_rows = scope.num_rows
+        num_cols = scope.num_columns
+        if num_rows and not num_cols:
             parent._ensure_columns_exist()
-        for col in scope._effective_columns:
-            fc = FilteredColumn(self, col)
-            self._insert_slice(fc, Access.Next, False, False)
-        if scope.num_rows != scope._num_effective_rows:
+        self._append_slices([FilteredColumn(self, col) for col in scope._effective_columns])
+        if num_cols and not num_rows:
             parent._ensure_rows_exist()
-        for row in scope._effective_rows:
-            fr = FilteredRow(self, row)
-            self._insert_slice(fr, Access.Next, False, False)
+        self._append_slices([FilteredRow(self, row) for row in scope._effective_rows])
         self._mark_initialized()
 
     def delete(self, *elems: TableElement) -> None:
@@ -52,16 +52,36 @@ class FilteredTable(Table):
         return self._parent
 
     def _get_parent_cell(self, pt: Table, pr: Row, pc: Column, create_if_sparse: bool, set_current: bool) -> Cell:
-        return super()._get_table_cell(pt, pr, pc, create_if_sparse, set_current)
+        # parent cells are invalidated when their row or column is deleted, so a valid cached cell is current
+        key = (id(pr), id(pc))
+        if not set_current:
+            cell = self._parent_cells.get(key)
+            if cell is not None and cell.is_valid:
+                return cell
+        cell = super()._get_table_cell(pt, pr, pc, create_if_sparse, set_current)
+        if cell is not None:
+            self._parent_cells[key] = cell
+        return cell
+
+    def _get_filtered_cell(self, row: FilteredRow, col: FilteredColumn, parent_cell: Cell) -> FilteredCell:
+        from . import FilteredCell
+
+        # a cached cell keeps its row and column alive, so their ids remain unique
+        key = (id(row), id(col))
+        cell = self._filtered_cells.get(key)
+        if cell is None or cell._parent is not parent_cell:
+            cell = FilteredCell(row, col, parent_cell)
+            self._filtered_cells[key] = cell
+        return cell
 
     def _get_cell(
         self, row: Row, col: Column, create_if_sparse: bool = True, set_to_current: bool = True
     ) -> Cell | None:
-        from . import FilteredColumn, FilteredRow, FilteredCell
+        from . import FilteredColumn, FilteredRow
 
         if isinstance(row, FilteredRow) and isinstance(col, FilteredColumn):
-            parent_cell = self._get_table_cell(self.parent, row.parent, col.parent, create_if_sparse, False)
-            return FilteredCell(row, col, parent_cell)
+            parent_cell = self._get_parent_cell(self.parent, row.parent, col.parent, create_if_sparse, False)
+            return self._get_filtered_cell(row, col, parent_cell)
         else:
             return self.parent._get_cell(
                 row.parent if isinstance(row, FilteredRow) else row,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Collection, Iterator
-from typing import cast, Optional, TYPE_CHECKING, Any, Final
+from collections.abc import Collection, Iterable, Iterator
+from itertools import chain
+from typing import AbstractSet, cast, FrozenSet, Optional, TYPE_CHECKING, Any, Final, Tuple, TypeVar
 from _weakref import ref
 
 from pyroaring import BitMap
-from ordered_set import OrderedSet
 
 from ..mixins import Derivable, Groupable
 from ..utils import JustInTimeSet
@@ -13,21 +13,47 @@ from ..utils import JustInTimeSet
 from . import ElementType, EventType, BaseElementState
 from . import TableElement
 from . import TableCellsElement
+from . import Cell
+from . import Table
 
 from ..exceptions import InvalidParentException
 from ..events import BlockedRequestException
 
 if TYPE_CHECKING:
     from . import TableSliceElement
-    from . import Table
     from . import Row
     from . import Column
-    from . import Cell
 
 
 SHIFT_BY: Final = 16
 SHIFT_MASK: Final = (1 << SHIFT_BY) - 1
 
+_T = TypeVar("_T")
+_E = TypeVar("_E", bound=TableElement)
+
+# shared by all empty member sets; a JustInTimeSet is only allocated once a member is added
+_NO_MEMBERS: Final[FrozenSet[Any]] = frozenset()
+
+
+def _encode(cell: Cell) -> int:
+    return (cell.row.index << SHIFT_BY) + cell.column.index
+
+
+def _added(members: AbstractSet[_T], elem: _T) -> AbstractSet[_T]:
+    jit = members if isinstance(members, JustInTimeSet) else JustInTimeSet[_T]()
+    jit.add(elem)
+    return jit
+
+
+def _valid_members(members: AbstractSet[_E]) -> AbstractSet[_E]:
+    valid = [m for m in members if m and m.is_valid]
+    return JustInTimeSet[_E](valid) if valid else _NO_MEMBERS
+
+
+def _discard(members: AbstractSet[_T], elem: _T) -> None:
+    if isinstance(members, JustInTimeSet):
+        members.discard(elem)
+
 
 class _GroupCellIterator:
     def __init__(self, group: Group) -> None:
@@ -43,9 +69,10 @@ class _GroupCellIterator:
         encoded_index = next(self._iter)
         r_idx = encoded_index >> SHIFT_BY
         c_idx = encoded_index & SHIFT_MASK
-        row = self.table.get_row(r_idx)
-        col = self.table.get_column(c_idx)
-        return self.table.get_cell(row, col)
+        table = self.table
+        row = table.get_row(r_idx)
+        col = table.get_column(c_idx)
+        return table.get_cell(row, col)
 
     @property
     def table(self) -> Table:
@@ -65,10 +92,8 @@ class Group(TableCellsElement, Groupable):
                 g._add(False, cell)
         return g
 
-    # noinspection PyTypeChecker
     @staticmethod
-    def _get_referenced_cells(t: Table, b: BitMap) -> Collection[Cell]:
-        cells: set[Cell] = OrderedSet()
+    def _get_referenced_cells(t: Table, b: BitMap) -> Iterator[Cell]:
         for ei in b:
             ri = ei >> SHIFT_BY
             ci = ei & SHIFT_MASK
@@ -80,38 +105,36 @@ class Group(TableCellsElement, Groupable):
                 continue
             cell = t.get_cell(r, c)
             if cell and cell.is_valid:
-                cells.add(cell)
-        return cells
+                yield cell
 
     def __init__(self, parent: Table, label: Optional[str] = None, *elems: TableElement) -> None:
-        from . import Table
-        from . import Row
-        from . import Column
-        from . import Cell
-
         if not isinstance(parent, Table):
             raise TypeError("Table required as first argument")
 
         super().__init__(parent)
         self.label = label
-        self.__cells = JustInTimeSet[Cell]()
-        self.__rows = JustInTimeSet[Row]()
-        self.__cols = JustInTimeSet[Column]()
-        self.__groups = JustInTimeSet[Group]()
-        self.__child_groups = JustInTimeSet[Group]()
-        self.__num_cells = 0
+        self._cells_set: AbstractSet[Cell] = _NO_MEMBERS
+        self._rows_set: AbstractSet[Row] = _NO_MEMBERS
+        self._cols_set: AbstractSet[Column] = _NO_MEMBERS
+        self._groups_set: AbstractSet[Group] = _NO_MEMBERS
+        self._child_groups: AbstractSet[Group] = _NO_MEMBERS
+        self._cell_count = 0
+        self._derived: Optional[Tuple[Derivable, ...]] = None
+        self._sorted_rows: Optional[Tuple[Row, ...]] = None
+        self._sorted_columns: Optional[Tuple[Column, ...]] = None
         self._mark_dirty()
 
-        self.__index_bitmap = BitMap()
+        self._bitmap = BitMap()
 
         # and mark instance as initialized
         self._mark_initialized()
 
         # associate to table
-        self.table._register_group(self)
+        table = self.table
+        table._register_group(self)
 
         # handle persistence
-        if self.table and self.table.is_groups_persistent_default:
+        if table and table.is_groups_persistent_default:
             self.is_persistent = True
 
         # add any elements specified
@@ -119,36 +142,31 @@ class Group(TableCellsElement, Groupable):
             self.add(*elems)
 
     def __contains__(self, x: TableElement | None) -> bool:
-        from . import Row
-        from . import Column
-        from . import Cell
-
-        with self._lock:
-            if isinstance(x, TableElement):
-                if isinstance(x, Cell):
-                    present = x in self.__cells
-                    return present or self._contains_cell_reference(x)
-                if isinstance(x, Group):
-                    return x in self.__groups
-                if isinstance(x, Row):
-                    return x in self.__rows
-                if isinstance(x, Column):
-                    return x in self.__cols
+        # anything that isn't a table element (including None) can't be a member
+        if not isinstance(x, TableElement):
             return False
+        # the member sets and the index bitmap guard themselves, so the group lock isn't needed
+        et = x.element_type
+        if et is ElementType.Cell:
+            return x in self._cells_set or self._contains_cell_reference(cast(Cell, x))
+        if et is ElementType.Row:
+            return x in self._rows_set
+        if et is ElementType.Column:
+            return x in self._cols_set
+        if et is ElementType.Group:
+            return x in self._groups_set
+        return False
 
     def __len__(self) -> int:
         return self.num_cells
 
-    def __del__(self) -> None:
-        super().__del__()
-
     def __and__(self, o: Group) -> Group:
         if not isinstance(o, Group):
             raise TypeError(f"unsupported operand type for Group &: '{type(o)}'")
         if o.table != self.table:
             raise InvalidParentException(self, o)
         with self.lock:
-            nbm = self._index_bitmap & o._index_bitmap
+            nbm = self._index_bitmap_raw & o._index_bitmap_raw
             return Group._create_group_from_bitmap(self.table, nbm)
 
     def __iand__(self, o: Group) -> Group:
@@ -157,7 +175,7 @@ class Group(TableCellsElement, Groupable):
         if o.table != self.table:
             raise InvalidParentException(self, o)
         with self.lock:
-            nbm = self._index_bitmap & o._index_bitmap
+            nbm = self._index_bitmap_raw & o._index_bitmap_raw
             # remove all group elements; they will be replaced with cell references
             self.__purge_components()
             for cell in Group._get_referenced_cells(self.table, nbm):
@@ -190,14 +208,9 @@ class Group(TableCellsElement, Groupable):
             raise TypeError(f"unsupported operand type for Group -: '{type(o)}'")
         if o.table != self.table:
             raise InvalidParentException(self, o)
-        # create the new, returned group
-        ng = Group(self.table)
-        # calculate the elements we need to add
-        nbm = self._index_bitmap.difference(o._index_bitmap)
-        for cell in Group._get_referenced_cells(self.table, nbm):
-            if cell and cell.is_valid:
-                ng._add(False, cell)
-        return ng
+        with self.lock:
+            nbm = self._index_bitmap_raw.difference(o._index_bitmap_raw)
+            return Group._create_group_from_bitmap(self.table, nbm)
 
     def __isub__(self, o: Group) -> Group:
         if not isinstance(o, Group):
@@ -205,7 +218,7 @@ class Group(TableCellsElement, Groupable):
         if o.table != self.table:
             raise InvalidParentException(self, o)
         # calculate the elements we need to add back
-        nbm = self._index_bitmap.difference(o._index_bitmap)
+        nbm = self._index_bitmap_raw.difference(o._index_bitmap_raw)
         # clear out existing items
         self.__purge_components()
         for cell in Group._get_referenced_cells(self.table, nbm):
@@ -218,14 +231,9 @@ class Group(TableCellsElement, Groupable):
             raise TypeError(f"unsupported operand type for Group -: '{type(o)}'")
         if o.table != self.table:
             raise InvalidParentException(self, o)
-        # create the new, returned group
-        ng = Group(self.table)
-        # calculate the elements we need to add
-        nbm = self._index_bitmap.symmetric_difference(o._index_bitmap)
-        for cell in Group._get_referenced_cells(self.table, nbm):
-            if cell and cell.is_valid:
-                ng._add(False, cell)
-        return ng
+        with self.lock:
+            nbm = self._index_bitmap_raw.symmetric_difference(o._index_bitmap_raw)
+            return Group._create_group_from_bitmap(self.table, nbm)
 
     def __ixor__(self, o: Group) -> Group:
         if not isinstance(o, Group):
@@ -233,7 +241,7 @@ class Group(TableCellsElement, Groupable):
         if o.table != self.table:
             raise InvalidParentException(self, o)
         # calculate the elements we need to add back
-        nbm = self._index_bitmap.symmetric_difference(o._index_bitmap)
+        nbm = self._index_bitmap_raw.symmetric_difference(o._index_bitmap_raw)
         # clear out existing items
         self.__purge_components()
         for cell in Group._get_referenced_cells(self.table, nbm):
@@ -259,8 +267,7 @@ class Group(TableCellsElement, Groupable):
         self.fire_events(self, EventType.OnDelete)
 
     def _contains_cell_reference(self, cell: Cell) -> bool:
-        cell_ref = (cell.row.index << SHIFT_BY) + cell.column.index
-        return cell_ref in self._index_bitmap
+        return _encode(cell) in self._index_bitmap_raw
 
     def __purge_components(self) -> None:
         for r in self._rows:
@@ -275,13 +282,9 @@ class Group(TableCellsElement, Groupable):
         for cl in self._cells:
             if cl:
                 cl._remove_from_group(self)
-        self.__rows.clear()
-        self.__cols.clear()
-        self.__groups.clear()
-        self.__cells.clear()
-        self.__child_groups.clear()
-        self.__index_bitmap.clear()
-        self.__num_cells = 0
+        self._rows_set = self._cols_set = self._groups_set = self._cells_set = self._child_groups = _NO_MEMBERS
+        self._bitmap.clear()
+        self._cell_count = 0
         self._mark_dirty()
 
     @property
@@ -293,7 +296,7 @@ class Group(TableCellsElement, Groupable):
             return False
         if self.table != o.table:
             return False
-        return bool(self._index_bitmap == o._index_bitmap)
+        return bool(self._index_bitmap_raw == o._index_bitmap_raw)
 
     def union(self, g: Group) -> Group:
         return self.__or__(g)
@@ -312,7 +315,11 @@ class Group(TableCellsElement, Groupable):
             raise TypeError(f"unsupported operand type for Group.jaccard_index: '{type(g)}'")
         if g.table != self.table:
             return 0.0
-        return cast(float, self._index_bitmap.jaccard_index(g._index_bitmap))
+        a = self._index_bitmap_raw
+        b = g._index_bitmap_raw
+        intersection = a.intersection_cardinality(b)
+        union = len(a) + len(b) - intersection
+        return intersection / union if union else 0.0
 
     similarity = jaccard_index
 
@@ -321,95 +328,95 @@ class Group(TableCellsElement, Groupable):
             raise TypeError(f"Argument 'o' has incorrect type; expected 'Group', got '{type(o).__name__}'")
         if o.table != self.table:
             raise InvalidParentException(self, o)
-        return bool(self._index_bitmap.issubset(o._index_bitmap))
+        return bool(self._index_bitmap_raw.issubset(o._index_bitmap_raw))
 
     def is_superset(self, o: Group) -> bool:
         if not isinstance(o, Group):
             raise TypeError(f"Argument 'o' has incorrect type; expected 'Group', got '{type(o).__name__}'")
         if o.table != self.table:
             raise InvalidParentException(self, o)
-        return bool(self._index_bitmap.issuperset(o._index_bitmap))
+        return bool(self._index_bitmap_raw.issuperset(o._index_bitmap_raw))
 
     def is_disjoint(self, o: Group) -> bool:
         if not isinstance(o, Group):
             raise TypeError(f"Argument 'o' has incorrect type; expected 'Group', got '{type(o).__name__}'")
         if o.table != self.table:
             raise InvalidParentException(self, o)
-        return bool(self._index_bitmap.isdisjoint(o._index_bitmap))
+        return bool(self._index_bitmap_raw.isdisjoint(o._index_bitmap_raw))
 
     def copy(self) -> Group:
         with self.lock:
             ng = Group(self.table)
-            for r in self.rows:
-                if r and r.is_valid:
-                    ng._add(False, r)
-            for c in self.columns:
-                if c and c.is_valid:
-                    ng._add(False, c)
-            for cl in self.__cells:
-                if cl and cl.is_valid:
-                    ng._add(False, cl)
-            for g in self.groups:
-                if g and g.is_valid:
-                    ng._add(False, g)
+            # the members were vetted when added to this group, so copy the sets wholesale
+            ng._rows_set = _valid_members(self._rows_set)
+            ng._cols_set = _valid_members(self._cols_set)
+            ng._cells_set = _valid_members(self._cells_set)
+            ng._groups_set = _valid_members(self._groups_set)
+            for elem in chain(ng._rows_set, ng._cols_set, ng._cells_set, ng._groups_set):
+                cast(Groupable, elem)._add_to_group(ng)
+            # and reuse the index, if it's current
+            if not self.is_dirty:
+                ng._bitmap = self._bitmap.copy()
+                ng._cell_count = self._cell_count
+                ng._mark_clean()
             return ng
 
     @property
     def is_label_indexed(self) -> bool:
-        return bool(self.table.is_group_labels_indexed) if self.table else False
+        table = self.table
+        return bool(table.is_group_labels_indexed) if table else False
 
     def _recalculate_index_bitmap(self, force_it: Optional[bool] = False) -> BitMap:
+        # a clean bitmap is read as-is; the dirty flag is rechecked under the lock before rebuilding
+        if not (force_it or self.is_dirty):
+            return self._bitmap
         with self.lock:
             if self.is_dirty or bool(force_it):
-                self.__index_bitmap.clear()
-
-                rows = self._effective_rows
-                row_index = 1
+                bitmap = self._bitmap
+                bitmap.clear()
 
+                # encode the row x column cross product, and load it in one call
                 cols = self._effective_columns
-                col_index = 1
-
-                for r in rows:
-                    r_idx = r.index if r else row_index
-                    row_index += 1
-                    for c in cols:
-                        c_idx = c.index if c else col_index
-                        # encode the cell index in the bitmap
-                        self.__index_bitmap.add((r_idx << SHIFT_BY) + c_idx)
-                        col_index += 1
-                    col_index = 1
+                if cols:
+                    r_encs = [(r.index if r else ri) << SHIFT_BY for ri, r in enumerate(self._effective_rows, 1)]
+                    c_idxs = [c.index if c else ci for ci, c in enumerate(cols, 1)]
+                    bitmap.update([r_enc + c_idx for r_enc in r_encs for c_idx in c_idxs])
 
                 # add cells
-                for cell in self.__cells:
-                    if cell and cell.is_valid:
-                        self.__index_bitmap.add((cell.row.index << SHIFT_BY) + cell.column.index)
+                if self._cells_set:
+                    bitmap.update([_encode(cell) for cell in self._cells_set if cell and cell.is_valid])
 
                 # add group cells
-                for g in self.__groups:
+                for g in self._groups_set:
                     if g and g.is_valid:
-                        self.__index_bitmap |= g._index_bitmap
+                        bitmap |= g._index_bitmap_raw
                 # update cell count
-                self.__num_cells = len(self.__index_bitmap)
+                self._cell_count = len(bitmap)
                 self._mark_clean()
-            return self.__index_bitmap
+            return self._bitmap
 
     @property
     def _index_bitmap(self) -> BitMap:
         with self.lock:
-            self._recalculate_index_bitmap()
-            return self.__index_bitmap.copy()
+            return self._recalculate_index_bitmap().copy()
+
+    @property
+    def _index_bitmap_raw(self) -> BitMap:
+        # the live bitmap, without the copy; callers must treat it as read-only
+        return self._recalculate_index_bitmap()
 
     @property
     def num_cells(self) -> int:
         # TODO: need RoaringBitmap implementation to handle 64bit ints
-        with self.lock:
-            if self.is_dirty:
-                self._recalculate_index_bitmap()
-            return self.__num_cells
+        # the count is updated before the group is marked clean, so a clean group can be read without the lock;
+        # _recalculate_index_bitmap takes the lock and rechecks the dirty flag
+        if self.is_dirty:
+            self._recalculate_index_bitmap()
+        return self._cell_count
 
     @property
     def _num_cells(self) -> int:
-        return len(self.__cells)
+        return len(self._cells_set)
 
     @property
     def is_null(self) -> bool:
@@ -417,15 +424,16 @@ class Group(TableCellsElement, Groupable):
 
     @property
     def num_rows(self) -> int:
-        return len(self.__rows)
+        return len(self._rows_set)
 
     @property
     def _effective_rows(self) -> Collection[Row]:
-        if self.num_rows:
-            return self.__rows
-        if self.table and self.num_columns:
-            return self.table._rows
-        return list()
+        if self._rows_set:
+            return self._rows_set
+        table = self.table
+        if table and self._cols_set:
+            return table._rows
+        return ()
 
     @property
     def _num_effective_rows(self) -> int:
@@ -433,26 +441,27 @@ class Group(TableCellsElement, Groupable):
 
     @property
     def _rows(self) -> Collection[Row]:
-        if self.__rows:
-            return list(self.__rows)
-        else:
-            return list()
+        return self._rows_set
 
     @property
     def rows(self) -> Collection[Row]:
-        return tuple(sorted(self._rows))
+        with self.lock:
+            if self._sorted_rows is None:
+                self._sorted_rows = tuple(sorted(self._rows_set))
+            return self._sorted_rows
 
     @property
     def num_columns(self) -> int:
-        return len(self.__cols)
+        return len(self._cols_set)
 
     @property
     def _effective_columns(self) -> Collection[Column]:
-        if self.num_columns:
-            return self.__cols
-        if self.table and self.num_rows:
-            return self.table._columns
-        return list()
+        if self._cols_set:
+            return self._cols_set
+        table = self.table
+        if table and self._rows_set:
+            return table._columns
+        return ()
 
     @property
     def _num_effective_columns(self) -> int:
@@ -460,22 +469,22 @@ class Group(TableCellsElement, Groupable):
 
     @property
     def _columns(self) -> Collection[Column]:
-        if self.__cols:
-            return list(self.__cols)
-        else:
-            return list()
+        return self._cols_set
 
     @property
     def columns(self) -> Collection[Column]:
-        return tuple(sorted(self._columns))
+        with self.lock:
+            if self._sorted_columns is None:
+                self._sorted_columns = tuple(sorted(self._cols_set))
+            return self._sorted_columns
 
     @property
     def num_groups(self) -> int:
-        return len(self.__groups)
+        return len(self._groups_set)
 
     @property
     def _groups(self) -> Collection[Group]:
-        return list(self.__groups)
+        return self._groups_set
 
     @property
     def groups(self) -> Collection[Group]:
@@ -483,83 +492,138 @@ class Group(TableCellsElement, Groupable):
 
     @property
     def _cells(self) -> Collection[Cell]:
-        return list(self.__cells)
+        return self._cells_set
 
     @property
     def cells(self) -> Iterator[Cell]:
         return _GroupCellIterator(self)
 
+    def _mark_dirty(self) -> None:
+        super()._mark_dirty()
+        # membership and table index changes both mark the group dirty and can reorder it
+        self._sorted_rows = self._sorted_columns = None
+        self._invalidate_derived_elements()
+        self.__mark_containing_groups_dirty()
+
+    def _invalidate_derived_elements(self) -> None:
+        if self._derived is not None:
+            self._derived = None
+            for g in self._child_groups:
+                if g:
+                    g._invalidate_derived_elements()
+
+    def __mark_containing_groups_dirty(self) -> None:
+        # groups this group has been added to must recalculate their cells, too
+        for g in self._child_groups:
+            if g and not g.is_dirty:
+                g._mark_dirty()
+
     def _add_to_group(self, g: Group) -> None:
-        self.__child_groups.add(g)
+        with self.lock:
+            self._child_groups = _added(self._child_groups, g)
 
     def _remove_from_group(self, g: Group) -> None:
-        self.__child_groups.discard(g)
+        _discard(self._child_groups, g)
 
     def add(self, *elems: TableElement) -> bool:
         return self._add(True, *elems)
 
     def _add(self, do_mark_dirty: Optional[bool] = True, *elems: TableElement) -> bool:
-        from . import Row
-        from . import Column
-        from . import Group
-        from . import Cell
-
         added_any = False
+        recalculate = False
         if elems:
             try:
                 with self.lock:
+                    # hoist the member sets out of the loop
+                    table = self.table
+                    rows, cols, groups, cells = self._rows_set, self._cols_set, self._groups_set, self._cells_set
                     for elem in elems:
                         if elem:
                             elem.vet_element()
-                            if elem.table != self.table:
+                            if elem.table != table:
                                 raise InvalidParentException(self, elem)
-                            if isinstance(elem, TableCellsElement):  # row, column, or group
-                                if isinstance(elem, Row):
-                                    added_any = True if elem not in self.__rows else added_any
-                                    self.__rows.add(elem)
-                                elif isinstance(elem, Column):
-                                    added_any = True if elem not in self.__cols else added_any
-                                    self.__cols.add(elem)
-                                elif isinstance(elem, Group):
-                                    if elem == self:
-                                        raise RecursionError("Cannot add group to itself")
-                                    added_any = True if elem not in self.__groups else added_any
-                                    self.__groups.add(elem)
-                                # TODO: Add Row and Column and Back Pointer
-                            elif isinstance(elem, Cell):
-                                if bool(do_mark_dirty) and added_any:
+                            # dispatch on element type rather than a chain of isinstance checks
+                            et = elem.element_type
+                            if et is ElementType.Cell:
+                                if bool(do_mark_dirty) and recalculate:
                                     self._mark_dirty()
-                                if not (elem in self.__cells or self._contains_cell_reference(elem)):
+                                cell = cast(Cell, elem)
+                                if not (cell in cells or self._contains_cell_reference(cell)):
                                     added_any = True
-                                    self.__cells.add(elem)
+                                    self._cells_set = cells = _added(cells, cell)
+                                    self._invalidate_derived_elements()
+                                    if not self.is_dirty:
+                                        # a cell contributes only itself, so patch the index bitmap in place
+                                        self._bitmap.add(_encode(cell))
+                                        self._cell_count += 1
+                                        self.__mark_containing_groups_dirty()
+                            elif et is ElementType.Row:
+                                if elem not in rows:
+                                    added_any = recalculate = True
+                                    self._rows_set = rows = _added(rows, cast("Row", elem))
+                            elif et is ElementType.Column:
+                                if elem not in cols:
+                                    added_any = recalculate = True
+                                    self._cols_set = cols = _added(cols, cast("Column", elem))
+                            elif et is ElementType.Group:
+                                if elem is self:
+                                    raise RecursionError("Cannot add group to itself")
+                                if elem not in groups:
+                                    added_any = recalculate = True
+                                    self._groups_set = groups = _added(groups, cast(Group, elem))
                             # set up the back-pointer from the element to this group
                             cast(Groupable, elem)._add_to_group(self)
             finally:
-                if added_any:
+                if recalculate:
                     self._mark_dirty()
         return added_any
 
     def remove(self, *elems: TableSliceElement | Group | Cell) -> None:
-        from . import Row
-        from . import Column
-        from . import Group
-        from . import Cell
-
         if not elems:
             return
 
+        recalculate = False
         with self.lock:
             for elem in elems:
                 cast(Groupable, elem)._remove_from_group(self)
-                if isinstance(elem, Row):
-                    self.__rows.discard(elem)
-                elif isinstance(elem, Column):
-                    self.__cols.discard(elem)
-                elif isinstance(elem, Group):
-                    self.__groups.discard(elem)
-                elif isinstance(elem, Cell):
-                    self.__cells.discard(elem)
-            self._mark_dirty()
+                et = elem.element_type
+                if et is ElementType.Row:
+                    _discard(self._rows_set, elem)
+                    recalculate = True
+                elif et is ElementType.Column:
+                    _discard(self._cols_set, elem)
+                    recalculate = True
+                elif et is ElementType.Group:
+                    _discard(self._groups_set, elem)
+                    recalculate = True
+                elif et is ElementType.Cell and elem in self._cells_set:
+                    _discard(self._cells_set, elem)
+                    self._invalidate_derived_elements()
+                    if self.is_dirty or not self.__remove_cell_reference(cast(Cell, elem)):
+                        recalculate = True
+            if recalculate:
+                self._mark_dirty()
+
+    def __remove_cell_reference(self, cell: Cell) -> bool:
+        """
+        Clears the cell's bit from a clean index bitmap, unless the group's rows, columns, or
+        subgroups also cover the cell; returns False if the bitmap must be recalculated instead
+        """
+        row = cell._row
+        col = cell._column
+        if row is None or col is None or row.is_invalid or col.is_invalid:
+            return False
+        rows, cols = self._rows_set, self._cols_set
+        if (rows or cols) and (not rows or row in rows) and (not cols or col in cols):
+            return True
+        cell_ref = (row.index << SHIFT_BY) + col.index
+        if any(cell_ref in g._index_bitmap_raw for g in self._groups_set if g and g.is_valid):
+            return True
+        if cell_ref in self._bitmap:
+            self._bitmap.discard(cell_ref)
+            self._cell_count -= 1
+            self.__mark_containing_groups_dirty()
+        return True
 
     def update(self, elems: Collection[TableElement]) -> bool:
         if elems:
@@ -568,11 +632,12 @@ class Group(TableCellsElement, Groupable):
 
     def fill(self, o: Any, preprocess: Optional[bool] = True) -> None:
         self.vet_element()
-        if self.table is None:
+        table = self.table
+        if table is None:
             raise InvalidParentException(cast(Table, None), self)
         self.__clear_component_derivations()
-        cr = self.table._current_cell
-        self.table.disable_automatic_recalculation()
+        cr = table._current_cell
+        table.disable_automatic_recalculation()
         any_changed = False
         try:
             for cell in self.cells:
@@ -583,9 +648,9 @@ class Group(TableCellsElement, Groupable):
             if any_changed:
                 self.fire_events(self, EventType.OnNewValue, o)
         finally:
-            self.table.enable_automatic_recalculation()
-            cr.set_current_cell_reference(self.table)
-        if self.table.is_automatic_recalculate_enabled:
+            table.enable_automatic_recalculation()
+            cr.set_current_cell_reference(table)
+        if table.is_automatic_recalculate_enabled:
             # TODO: recalculate
             pass
 
@@ -594,27 +659,28 @@ class Group(TableCellsElement, Groupable):
 
     @TableElement.is_persistent.setter  # type: ignore[attr-defined]
     def is_persistent(self, state: bool) -> None:
-        if self.table is None:
+        table = self.table
+        if table is None:
             raise InvalidParentException(cast(Table, None), self)
         if bool(state):
-            self.table._persistent_groups.add(self)
+            table._persistent_groups.add(self)
         else:
-            self.table._persistent_groups.discard(self)
+            table._persistent_groups.discard(self)
         self._mutate_state(BaseElementState.IS_PERSISTENT_FLAG, state)
 
     # if the group consists of only rows or only columns,
     # clear derivations from those elements
     def __clear_component_derivations(self) -> None:
-        num_rows = len(self.__rows)
-        num_cols = len(self.__cols)
+        num_rows = len(self._rows_set)
+        num_cols = len(self._cols_set)
 
         if num_rows > 0 and num_cols == 0:
-            for row in self.__rows:
+            for row in self._rows_set:
                 if row:
                     row.clear_derivation()
                     row.clear_time_series()
         elif num_rows == 0 and num_cols > 0:
-            for col in self.__cols:
+            for col in self._cols_set:
                 if col:
                     col.clear_derivation()
                     col.clear_time_series()
@@ -632,18 +698,20 @@ class Group(TableCellsElement, Groupable):
     @property
     def derived_elements(self) -> Collection[Derivable]:
         self.vet_element()
-        derived = OrderedSet()
-
-        for row in self._effective_rows:
-            if row and row.is_valid and row.is_derived:
-                derived.add(row)
-        for col in self._effective_columns:
-            if col and col.is_valid and col.is_derived:
-                derived.add(col)
-        for group in self.__groups:
-            if group and group.is_valid:
-                derived.update(cast(OrderedSet, group.derived_elements))
-        for cell in self.__cells:
-            if cell and cell.is_valid and cell.is_derived:
-                derived.add(cell)
-        return cast(Collection[Derivable], derived)
+        with self.lock:
+            # membership changes and new cell derivations reset the cached set
+            if self._derived is None:
+                derived: Iterable[Derivable] = chain(
+                    (r for r in self._effective_rows if r and r.is_valid and r.is_derived),
+                    (c for c in self._effective_columns if c and c.is_valid and c.is_derived),
+                )
+                # leaf groups, the common case, skip the subgroup recursion entirely
+                if self._groups_set:
+                    derived = chain(
+                        derived,
+                        chain.from_iterable(g.derived_elements for g in self._groups_set if g and g.is_valid),
+                    )
+                derived = chain(derived, (x for x in self._cells_set if x and x.is_valid and x.is_derived))
+                # a dict doubles as an insertion-ordered set
+                self._derived = tuple(dict.fromkeys(derived))
+            return self._derived
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from _weakref import ref
 from collections.abc import Collection, Iterator
-from typing import Optional, TYPE_CHECKING
+from typing import Final, Optional, TYPE_CHECKING
 
 from ..exceptions import InvalidException
 from ..exceptions import UnsupportedException
@@ -26,18 +26,21 @@ class _RowCellIterator:
         self._index = 0
         self._row = row
         self._table_ref = ref(row.table) if row else None
-        self._num_cols = self.table.num_columns if self.table else 0
+        table = self.table
+        self._num_cols = table.num_columns if table else 0
 
     def __iter__(self) -> Iterator[Cell]:
         self._index = 0
-        self._num_cols = self.table.num_columns if self.table else 0
+        table = self.table
+        self._num_cols = table.num_columns if table else 0
         return self
 
     def __next__(self) -> Cell:
         if self._index < self._num_cols:
             self._index += 1
-            col: Column = self.table._get_slice(  # type: ignore[assignment]
-                ElementType.Column, self.table._columns, Access.ByIndex, True, False, self._index
+            table = self.table
+            col: Column = table._get_slice(  # type: ignore[assignment]
+                ElementType.Column, table._columns, Access.ByIndex, True, False, self._index
             )
             cell = col._get_cell(self._row, True, False)
             return cell  # type: ignore[return-value]
@@ -55,18 +58,26 @@ class _RowCellIterator:
 
 # noinspection DuplicatedCode
 class Row(TableSliceElement):
+    element_type: Final = ElementType.Row
+    slices_type: Final = ElementType.Column
+
+    __slots__ = ["__cell_offset", "_cell_count", "_proxy", "_filters", "__weakref__"]
+
     def __init__(self, te: Table, parent_row: Optional[Row] = None) -> None:
-        from .filters import FilteredRow
-        from .filters import FilteredTable
+        # if parent row is specified, te must be a FilteredTable; plain rows never need the filters package
+        if parent_row:
+            from .filters import FilteredRow
+            from .filters import FilteredTable
 
-        # if parent row is specified, te must be a FilteredTable
-        if parent_row and te and not isinstance(te, FilteredTable):
-            raise UnsupportedException(self, "FilteredTable Required")
+            if te and not isinstance(te, FilteredTable):
+                raise UnsupportedException(self, "FilteredTable Required")
 
         super().__init__(te)
         self.__cell_offset = -1
+        self._cell_count = 0
         self._proxy: Row | None = parent_row
-        self._filters = JustInTimeSet[FilteredRow]()
+        # most slices are never filtered, so the set is only allocated on the first registration
+        self._filters: Optional[JustInTimeSet[FilteredRow]] = None
 
         # initialize properties
         for p in self.element_type.initializable_properties():
@@ -78,8 +89,6 @@ class Row(TableSliceElement):
         # don't mark as intialized; Rows should only be created by methods in Table
 
     def _delete(self, compress: bool = True) -> None:
-        from .filters import FilteredRow
-
         if self.is_invalid:
             return
         try:
@@ -88,28 +97,31 @@ class Row(TableSliceElement):
             return
 
         # for filter rows, deregister from parent
-        if self._proxy and isinstance(self, FilteredRow):
-            self._proxy.deregister_filter(self)
+        if self._proxy:
+            from .filters import FilteredRow
 
-        # delete all filter rows based on this (self)
-        while self._filters:
-            fr = self._filters.pop()
-            if fr:
-                fr.delete()
+            if isinstance(self, FilteredRow):
+                self._proxy.deregister_filter(self)
 
-        # for good measure
-        self._filters.clear()
+        # delete all filter rows based on this (self)
+        if self._filters:
+            filters = list(self._filters)
+            self._filters.clear()
+            for fr in filters:
+                if fr:
+                    fr.delete()
 
         # clean up remote handlers
         if self._remote_uuids:
             self._clear_remote_uuids()
 
         # remove row from parent table
+        table = self.table
         try:
-            if self.table:
-                with self.table.lock:
+            if table:
+                with table.lock:
                     index = self.index - 1
-                    if index < 0 or index >= self.table.num_rows:
+                    if index < 0 or index >= table.num_rows:
                         raise InvalidException(self, f"Row index {index+1} outside of parent table")
                     self._remove_from_all_groups()
 
@@ -119,28 +131,25 @@ class Row(TableSliceElement):
                     self._clear_affects()
 
                     # remove the row from the table
-                    if self.table._rows[index] != self:
+                    if table._rows[index] != self:
                         raise InvalidException(self, "Invalid state: removed row doesn't equal itself")
-                    self.table._rows.__delitem__(index)
+                    table._rows.__delitem__(index)
 
                     # reindex the rows after the one removed
-                    if index < self.table.num_rows:
-                        for r in self.table._rows[index:]:
-                            if r:
-                                r._set_index(r.index - 1)
+                    self._reindex_slice(table._rows, index)
 
                     # cache the cell offset so that it can be reused
-                    self.table._cache_cell_offset(self._cell_offset)
+                    table._cache_cell_offset(self._cell_offset)
 
                     # clear this element from the current cell stack
-                    self.table._purge_current_stack(self)
+                    table._purge_current_stack(self)
 
                     # clear current row if this one
-                    if self.table.current_row == self:
-                        self.table.current_row = None
+                    if table.current_row == self:
+                        table.current_row = None
 
                     if bool(compress):
-                        self.table._reclaim_row_space()
+                        table._reclaim_row_space()
         finally:
             self._set_cell_offset(-1)
             self._set_index(-1)
@@ -155,56 +164,49 @@ class Row(TableSliceElement):
 
     def _set_cell_offset(self, offset: int) -> None:
         self.__cell_offset = offset
-        if offset >= 0 and self.table:
-            self.table._map_cell_offset_to_row(self)
+        if offset >= 0:
+            table = self.table
+            if table:
+                table._map_cell_offset_to_row(self)
 
     def _get_cell(self, col: Column, set_to_current: bool = True, create_if_sparse: bool = True) -> Cell | None:
         self.vet_components(col)
-        return col._get_cell(self, set_to_current, create_if_sparse)
+        # Column._get_cell takes its flags in the opposite order, so pass them by name
+        return col._get_cell(self, create_if_sparse=create_if_sparse, set_to_current=set_to_current)
 
     def get_cell(self, col: Column) -> Cell | None:
-        return self._get_cell(col, set_to_current=True, create_if_sparse=True)
+        self.vet_components(col)
+        return col._get_cell(self, True, True)
 
     def register_filter(self, filtered: FilteredRow) -> None:
+        if self._filters is None:
+            self._filters = JustInTimeSet()
         self._filters.add(filtered)
 
     def deregister_filter(self, filtered: FilteredRow) -> None:
-        self._filters.discard(filtered)
-
-    @property
-    def element_type(self) -> ElementType:
-        return ElementType.Row
+        if self._filters is not None:
+            self._filters.discard(filtered)
 
     @property
     def num_slices(self) -> int:
-        return self.table.num_columns if self.table else 0
-
-    @property
-    def slices_type(self) -> ElementType:
-        return ElementType.Column
+        table = self.table
+        return table.num_columns if table else 0
 
     def mark_current(self) -> Row | None:
         self.vet_element()
-        return self.table.mark_current(self) if self.table else None
+        table = self.table
+        return table.mark_current(self) if table else None
 
     @property
     def num_cells(self) -> int:
         self.vet_element()
-        if self._cell_offset < 0:
-            return 0
-        if self.table is None:
-            raise InvalidException(self, "Row must belong to a Table")
-        num_cells = 0
-        if self.table._columns:
-            for col in self.table._columns:
-                if col and self._cell_offset < col._num_cells:
-                    if col._get_cell(self, False, False):
-                        num_cells += 1
-        return num_cells
+        # maintained as the row's cells are created and invalidated
+        return self._cell_count
 
     @property
     def _num_cells(self) -> int:
-        return self.table.num_columns if self.table else 0
+        table = self.table
+        return table.num_columns if table else 0
 
     @property
     def is_null(self) -> bool:
@@ -212,7 +214,8 @@ class Row(TableSliceElement):
 
     @property
     def is_label_indexed(self) -> bool:
-        return bool(self.table.is_row_labels_indexed) if self.table else False
+        table = self.table
+        return bool(table.is_row_labels_indexed) if table else False
 
     @property
     def derived_elements(self) -> Collection[Derivable]:
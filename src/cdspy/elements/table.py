@@ -5,8 +5,8 @@ from collections.abc import Iterator
 from weakref import WeakValueDictionary, WeakKeyDictionary, ref
 import threading
 
-from typing import Any, cast, Dict, List, Optional
-from typing import overload, Set, TYPE_CHECKING, Tuple, Collection
+from typing import Any, cast, Dict, Final, List, Optional
+from typing import overload, Sequence, Set, TYPE_CHECKING, Tuple, Collection
 
 import uuid
 
@@ -47,6 +47,10 @@ if TYPE_CHECKING:
 # create thread local storage, but only once for the module
 _THREAD_LOCAL_TABLE_STORAGE = threading.local()
 
+_AUTO_RECALCULATE: Final = BaseElementState.AUTO_RECALCULATE_FLAG.value
+_AUTO_RECALCULATE_DISABLED: Final = BaseElementState.AUTO_RECALCULATE_DISABLED_FLAG.value
+_CAPACITY_INCR_PROPERTIES: Final = {p.name.lower(): p for p in (Property.RowCapacityIncr, Property.ColumnCapacityIncr)}
+
 
 class _CellReference:
     def __init__(self, cr: _CellReference | None = None) -> None:
@@ -82,45 +86,46 @@ class _CellReference:
 class _TableCellIterator:
     def __init__(self, t: Table) -> None:
         BaseElement.vet_base_element(t)
-        self._r_index = self._c_index = 0
         self._table_ref = ref(t) if t else None
-        self._num_rows = self.table.num_rows if self.table else 0
-        self._num_columns = self.table.num_columns if self.table else 0
+        self.__iter__()  # initialize iterator fields
 
     @property
     def table(self) -> Table:
         return self._table_ref() if self._table_ref else None  # type: ignore[return-value]
 
     def __iter__(self) -> Iterator[Cell]:
-        self._r_index = self._c_index = 0
-
-        self.table._ensure_rows_exist()
-        self._rows = self.table.rows if self.table else []
-        self._num_rows = len(self._rows)
-
-        self.table._ensure_columns_exist()
-        self._columns = self.table.columns if self.table else []
-        self._num_columns = len(self._columns)
+        table = self.table
+        self._rows: Collection[Row] = table.rows if table else ()
+        self._columns: Collection[Column] = table.columns if table else ()
+        self._cells = self.__cells()
+        self._peeked: Optional[Cell] = None
         return self
 
+    def __cells(self) -> Iterator[Cell]:
+        # walk the table a column at a time, the order in which column cells are stored
+        rows = self._rows
+        for col in self._columns:
+            for row in rows:
+                # existing cells are read straight from the column; only sparse slots take the locked path
+                cells = col._cells
+                offset = row._cell_offset
+                cell = cells[offset] if 0 <= offset < len(cells) else None
+                yield cell if cell is not None else cast("Cell", col._get_cell(row, True, False))
+
     @property
     def has_next(self) -> bool:
         BaseElement.vet_base_element(self.table)
-        return self._r_index < self._num_rows and self._c_index < self._num_columns
+        # peek one cell ahead; the generator never yields None
+        if self._peeked is None:
+            self._peeked = next(self._cells, None)
+        return self._peeked is not None
 
     def __next__(self) -> Cell:
         if not self.has_next:
             raise StopIteration
-        col = self._columns[self._c_index]  # type: ignore[index]
-        row = self._rows[self._r_index]  # type: ignore[index]
-        cell = col._get_cell(row, True, False)
-        # increment pointers for next iteration
-        self._r_index += 1
-        if self._r_index >= self._num_rows:
-            self._r_index = 0
-            self._c_index += 1
-        # return the next cell
-        return cell  # type: ignore[no-any-return]
+        cell = cast("Cell", self._peeked)
+        self._peeked = None
+        return cell
 
 
 class Table(TableCellsElement):
@@ -160,51 +165,43 @@ class Table(TableCellsElement):
         )
         self._context: TableContext = parent_context
 
+        # capacity increments are read on every allocation and reclaim, so they are cached;
+        # the property mutators refresh the cache whenever either property is written
+        self._row_capacity_incr: int = parent_context.row_capacity_incr_default
+        self._column_capacity_incr: int = parent_context.column_capacity_incr_default
+
         # finally, with context set, initialize default properties
         for p in ElementType.Table.initializable_properties():
             source = template_table if template_table else parent_context
             self._initialize_property(p, source.get_property(p))
 
         # Initialize other instance attributes
-        self.__rows = ArrayList[Row](
-            initial_capacity=max(num_rows, self.row_capacity_incr), capacity_increment=self.row_capacity_incr
-        )
+        self._rows_capacity = self._calculate_rows_capacity(num_rows)
+        self._columns_capacity = self._calculate_columns_capacity(num_cols)
+
+        self.__rows = ArrayList[Row](initial_capacity=self._rows_capacity, capacity_increment=self._row_capacity_incr)
         self.__cols = ArrayList[Column](
-            initial_capacity=max(num_cols, self.column_capacity_incr), capacity_increment=self.column_capacity_incr
+            initial_capacity=self._columns_capacity, capacity_increment=self._column_capacity_incr
         )
 
         self._next_row_index = 0
         self._next_column_index = 0
 
         self._cell_offset_row_map: Dict[int, Row] = {}
-        self._unused_cell_offsets = deque[int]()
+        # freed cell offsets, reused most recently freed first
+        self._unused_cell_offsets: List[int] = []
         self.__next_cell_offset_index = 0
 
-        self._rows_capacity = self._calculate_rows_capacity(num_rows)
-        self._columns_capacity = self._calculate_columns_capacity(num_cols)
-
         self._row_label_index: Dict[str, Row] = {}
         self._col_label_index: Dict[str, Column] = {}
         self._cell_label_index: Dict[str, Cell] = {}
         self._group_label_index: Dict[str, Group] = cast(Dict[str, Group], WeakValueDictionary())
 
-        self._element_label_indexes: Dict[ElementType, Dict[str, TableElement]] = {
-            ElementType.Row: self._row_label_index,  # type: ignore[dict-item]
-            ElementType.Column: self._col_label_index,  # type: ignore[dict-item]
-            ElementType.Cell: self._cell_label_index,  # type: ignore[dict-item]
-            ElementType.Group: self._group_label_index,  # type: ignore[dict-item]
-        }
-
         self._filters = JustInTimeSet[FilteredTable]()
 
         self._groups = JustInTimeSet[Group]()
         self._persistent_groups: Set[Group] = set()
 
-        self._cell_properties: Dict[Cell, Dict] = {}
-        self._cell_groups: Dict[Cell, Set[Group]] = {}
-        self._cell_affects: Dict[Cell, Set[Derivable]] = {}
-        self._cell_derivations: Dict[Cell, Derivation] = {}
-
         self._ident_index: WeakValueDictionary[int, TableCellsElement] = WeakValueDictionary()
         self._uuid_index: WeakValueDictionary[uuid.UUID, TableCellsElement] = WeakValueDictionary()
 
@@ -222,14 +219,12 @@ class Table(TableCellsElement):
 
     def delete(self, *elems: TableElement) -> None:
         if elems:
-            deleted_any = False
-            for elem in elems:
-                if elem and elem.is_valid and elem.table == self:
+            # elements invalidated by an earlier delete in this batch are skipped by their own _delete
+            valid = [elem for elem in elems if elem is not None and elem.is_valid and elem.table is self]
+            if valid:
+                for elem in valid:
                     elem._delete(False)
-                    del elem
-                    deleted_any = True
 
-            if deleted_any:
                 self._reclaim_row_space()
                 self._reclaim_column_space()
                 # mark all groups as dirty, forcing recalc of composition
@@ -252,18 +247,17 @@ class Table(TableCellsElement):
         with self.lock:
             try:
                 # delete filters first
-                while self._filters:
-                    ft = self._filters.pop()
+                filters = list(self._filters)
+                self._filters.clear()
+                for ft in filters:
                     ft.delete()
 
-                # explicitly delete columns and rows
-                for index in range(self.num_columns, 0, -1):
-                    c = self._columns[index - 1]
+                # explicitly delete columns and rows, last first; each delete removes itself from the list
+                for c in reversed(list(self.__cols)):
                     if c is not None:
                         c._delete()
 
-                for index in range(self.num_rows, 0, -1):
-                    r = self._rows[index - 1]
+                for r in reversed(list(self.__rows)):
                     if r is not None:
                         r._delete()
 
@@ -271,18 +265,15 @@ class Table(TableCellsElement):
                     self._reclaim_column_space()
                     self._reclaim_row_space()
 
-                for x in self._element_label_indexes.values():
-                    x.clear()
-                self._element_label_indexes.clear()
+                self._row_label_index.clear()
+                self._col_label_index.clear()
+                self._cell_label_index.clear()
+                self._group_label_index.clear()
                 self._groups.clear()
                 self._persistent_groups.clear()
                 self._affects.clear()
                 self._cell_offset_row_map.clear()
                 self._unused_cell_offsets.clear()
-                self._cell_properties.clear()
-                self._cell_groups.clear()
-                self._cell_affects.clear()
-                self._cell_derivations.clear()
                 self.__rows.clear()
                 self.__cols.clear()
                 self._ident_index.clear()
@@ -299,16 +290,21 @@ class Table(TableCellsElement):
     def _get_cell_element_properties(self, cell: Cell, create_if_empty: bool = False) -> Optional[Dict]:
         if cell:
             with cell.lock:
-                cell_props = self._cell_properties.get(cell, None)
-                if bool(create_if_empty) and cell_props is None:
-                    cell_props = dict()
-                    self._cell_properties[cell] = cell_props
-                return cell_props
+                if bool(create_if_empty) and cell._props is None:
+                    cell._props = dict()
+                return cell._props
         return None
 
-    def _reset_cell_element_properties(self, cell: Cell) -> None:
-        if cell:
-            self._cell_properties.pop(cell, None)
+    def _label_index_for(self, et: ElementType) -> Dict[str, TableElement]:
+        if et is ElementType.Row:
+            return self._row_label_index  # type: ignore[return-value]
+        elif et is ElementType.Column:
+            return self._col_label_index  # type: ignore[return-value]
+        elif et is ElementType.Cell:
+            return self._cell_label_index  # type: ignore[return-value]
+        elif et is ElementType.Group:
+            return self._group_label_index  # type: ignore[return-value]
+        raise UnsupportedException(self, f"{et.name} labels are not indexed")
 
     def _register_filter(self, ft: FilteredTable) -> None:
         self._filters.add(ft)
@@ -354,27 +350,26 @@ class Table(TableCellsElement):
             self._persistent_groups.discard(g)
 
     def _register_group_cell(self, cell: Cell, group: Group) -> bool:
-        groups = self._cell_groups.get(cell, None)
+        groups = cell._groups
         if groups is None:
-            groups = set()
-            self._cell_groups[cell] = groups
+            groups = cell._groups = set()
         preexists = group in groups
         groups.add(group)
         return preexists
 
     def _deregister_group_cell(self, cell: Cell, group: Group) -> bool:
-        groups = self._cell_groups.get(cell, None)
+        groups = cell._groups
         if groups is None:
             return False
         else:
             existed = group in groups
             groups.discard(group)
             if len(groups) == 0:
-                del self._cell_groups[cell]
+                cell._groups = None
             return existed
 
     def _get_cell_groups(self, cell: Cell) -> Set[Group]:
-        return self._cell_groups.get(cell, set())
+        return cell._groups if cell._groups is not None else set()
 
     def _register_cell_affects(self, cell: Cell, d: Derivable) -> None:
         pass
@@ -383,11 +378,9 @@ class Table(TableCellsElement):
         pass
 
     def _get_cell_affects(self, cell: Cell, include_indirects: bool = True) -> List[Derivable]:
-        affected = self._cell_affects.get(cell, set())
-        num_affects = len(affected)
         affects: Set[Derivable] = set()
-        if num_affects > 0:
-            affects.update(affected)
+        if cell._affects:
+            affects.update(cell._affects)
 
         if bool(include_indirects):
             if cell.column:
@@ -400,14 +393,16 @@ class Table(TableCellsElement):
         return list(affects)
 
     def _get_cell_derivation(self, cell: Cell) -> Derivation:
-        return self._cell_derivations.get(cell, cast(Derivation, None))
+        return cast(Derivation, cell._derivation)
 
     def _register_cell_derivation(self, cell: Cell, d: Derivation) -> Derivation:
         if cell and d:
             with cell.lock:
                 cell._set(BaseElementState.IS_DERIVED_CELL_FLAG)
-                old_d = self._cell_derivations.get(cell, None)
-                self._cell_derivations[cell] = d
+                old_d = cell._derivation
+                cell._derivation = d
+                for g in self._get_cell_groups(cell):
+                    g._invalidate_derived_elements()
                 return cast(Derivation, old_d)
         return cast(Derivation, None)
 
@@ -421,7 +416,7 @@ class Table(TableCellsElement):
 
     @property
     def row_capacity_incr(self) -> int:
-        return cast(int, self.get_property(Property.RowCapacityIncr))
+        return self._row_capacity_incr
 
     @row_capacity_incr.setter
     def row_capacity_incr(self, default: int) -> None:
@@ -429,19 +424,58 @@ class Table(TableCellsElement):
 
     @property
     def column_capacity_incr(self) -> int:
-        return cast(int, self.get_property(Property.ColumnCapacityIncr))
+        return self._column_capacity_incr
 
     @column_capacity_incr.setter
     def column_capacity_incr(self, default: int) -> None:
         self._set_property(Property.ColumnCapacityIncr, default)
 
+    @staticmethod
+    def _capacity_incr_key(key: Property | str) -> Property | str:
+        # the cached capacity increments are also addressable by name, e.g., set_property("RowCapacityIncr", 512)
+        if isinstance(key, str):
+            return _CAPACITY_INCR_PROPERTIES.get(" ".join(key.lower().split()), key)
+        return key
+
+    def _refresh_capacity_incr(self, key: Property | str) -> None:
+        if key is Property.RowCapacityIncr:
+            incr = self.get_property(key)
+            self._row_capacity_incr = cast(int, incr if incr else self.table_context.row_capacity_incr_default)
+        elif key is Property.ColumnCapacityIncr:
+            incr = self.get_property(key)
+            self._column_capacity_incr = cast(int, incr if incr else self.table_context.column_capacity_incr_default)
+
+    def _set_property(self, key: Property | str, value: Any) -> Any:
+        with self.lock:
+            key = self._capacity_incr_key(key)
+            retval = super()._set_property(key, value)
+            self._refresh_capacity_incr(key)
+            return retval
+
+    def _initialize_property(self, key: Property | str, value: Any) -> Any:
+        with self.lock:
+            key = self._capacity_incr_key(key)
+            retval = super()._initialize_property(key, value)
+            self._refresh_capacity_incr(key)
+            return retval
+
+    def _clear_property(self, key: Property | str) -> bool:
+        with self.lock:
+            key = self._capacity_incr_key(key)
+            key_present = super()._clear_property(key)
+            self._refresh_capacity_incr(key)
+            return key_present
+
+    def get_property(self, key: Property | str | None) -> Any:
+        return super().get_property(self._capacity_incr_key(key) if key else key)
+
     @property
     def is_automatic_recalculate_enabled(self) -> bool:
-        return self.is_automatic_recalculation and not self._is_set(BaseElementState.AUTO_RECALCULATE_DISABLED_FLAG)
+        return self._state & (_AUTO_RECALCULATE | _AUTO_RECALCULATE_DISABLED) == _AUTO_RECALCULATE
 
     @property
     def is_automatic_recalculation(self) -> bool:
-        return self._is_set(BaseElementState.AUTO_RECALCULATE_FLAG)
+        return (self._state & _AUTO_RECALCULATE) != 0
 
     @is_automatic_recalculation.setter
     def is_automatic_recalculation(self, state: bool) -> None:
@@ -456,19 +490,17 @@ class Table(TableCellsElement):
     def _cache_cell_offset(self, offset: int) -> None:
         if offset >= 0:
             with self.lock:
-                self._unused_cell_offsets.append(offset)
-                for c in self._columns:
-                    if c:
+                # clear the slot in every column before the offset becomes available for reuse
+                for c in self.__cols:
+                    if c is not None:
                         c._invalidate_cell(offset)
+                self._unused_cell_offsets.append(offset)
 
     @property
     def _next_cell_offset(self) -> int:
         with self.lock:
             if self._unused_cell_offsets:
-                try:
-                    return self._unused_cell_offsets.popleft()
-                except IndexError:
-                    pass  # this shouldn't happen because of lock
+                return self._unused_cell_offsets.pop()
             self.__next_cell_offset_index += 1
             return self.__next_cell_offset_index - 1
 
@@ -478,12 +510,13 @@ class Table(TableCellsElement):
 
     def _row_by_cell_offset(self, offset: int) -> Row:
         if int(offset) >= 0:
-            with self.lock:
-                try:
-                    return self._cell_offset_row_map[offset]
-                except KeyError:
-                    pass
-        return cast(Row, None)
+            # dict reads are atomic; only a miss needs the lock, as the map may be mid-rebuild
+            row = self._cell_offset_row_map.get(offset)
+            if row is None:
+                with self.lock:
+                    row = self._cell_offset_row_map.get(offset)
+            return cast("Row", row)
+        return cast("Row", None)
 
     def __index_element_labels(self, elems: Collection[T], label_index: Dict[str, T], flag: BaseElementState) -> None:
         with self.lock:
@@ -492,17 +525,18 @@ class Table(TableCellsElement):
             if not elems:
                 self._reset(flag)
             else:
-                for elem in elems:
-                    if elem:
-                        label = elem.label
-                        if label:
-                            label = label.strip().lower()
-                            if label in label_index:
-                                label_index.clear()
-                                self._reset(flag)
-                                raise KeyError(f"{elem.element_type.name} Label '{elem.label}' not unique")
-                            else:
-                                label_index[label] = elem
+                labels = [(elem.label, elem) for elem in elems if elem]
+                keyed = [(label.strip().lower(), elem) for label, elem in labels if label]
+                indexed = dict(keyed)
+                if len(indexed) != len(keyed):
+                    # a label collided; report the first element whose label was already taken
+                    self._reset(flag)
+                    seen = set()
+                    for key, elem in keyed:
+                        if key in seen:
+                            raise KeyError(f"{elem.element_type.name} Label '{elem.label}' not unique")
+                        seen.add(key)
+                label_index.update(indexed)
 
     @property
     def is_column_labels_indexed(self) -> bool:
@@ -572,18 +606,13 @@ class Table(TableCellsElement):
         return self.__cols
 
     def _calculate_rows_capacity(self, num_required: int) -> int:
-        capacity = self.row_capacity_incr
-        if num_required > 0:
-            remainder = num_required % capacity
-            capacity = num_required + (capacity - remainder if remainder > 0 else 0)
-        return capacity
+        # round up to a whole number of increments, allocating at least one
+        incr = self._row_capacity_incr
+        return max(-(-num_required // incr), 1) * incr
 
     def _calculate_columns_capacity(self, num_required: int) -> int:
-        capacity = self.column_capacity_incr
-        if num_required > 0:
-            remainder = num_required % capacity
-            capacity = num_required + (capacity - remainder if remainder > 0 else 0)
-        return capacity
+        incr = self._column_capacity_incr
+        return max(-(-num_required // incr), 1) * incr
 
     # noinspection DuplicatedCode
     def _reclaim_column_space(self) -> None:
@@ -597,7 +626,7 @@ class Table(TableCellsElement):
 
         if self.free_space_threshold > 0:
             free_cols = self._columns.capacity - len(self._columns)
-            incr = self.column_capacity_incr
+            incr = self._column_capacity_incr
             ratio = float(free_cols) / incr
 
             if ratio > self.free_space_threshold or len(self._columns) == 0:
@@ -616,7 +645,7 @@ class Table(TableCellsElement):
 
         if self.free_space_threshold > 0:
             free_rows = self._rows.capacity - len(self._rows)
-            incr = self.row_capacity_incr
+            incr = self._row_capacity_incr
             ratio = float(free_rows) / incr
 
             if ratio > self.free_space_threshold or len(self._rows) == 0:
@@ -743,14 +772,12 @@ class Table(TableCellsElement):
     @property
     def num_cells(self) -> int:
         self.vet_element()
-        num_cells = 0
-        for c in self._columns:
-            num_cells += c.num_cells if c else 0
-        return num_cells
+        return sum(c.num_cells for c in self.__cols if c is not None)
 
     @property
     def is_null(self) -> bool:
-        return self.num_rows == 0 or self.num_columns == 0 or self.num_cells == 0
+        # only need to find one populated column, not count every cell
+        return len(self.__rows) == 0 or not any(c.num_cells for c in self.__cols if c is not None)
 
     @property
     def num_groups(self) -> int:
@@ -765,11 +792,11 @@ class Table(TableCellsElement):
             self.vet_element()
 
             any_changed = False
-            cr = self._current_cell
             self.disable_automatic_recalculation()
             try:
-                col = self.get_column(Access.First)
-                while col:
+                # walk the columns directly, rather than stepping the current column with Access.Next
+                self._ensure_columns_exist()
+                for col in list(self.__cols):
                     if col._fill(
                         o,
                         preserve_current=False,
@@ -779,10 +806,8 @@ class Table(TableCellsElement):
                         recalculate=False,
                     ):
                         any_changed = True
-                    col = self.get_column(Access.Next)
             finally:
                 self.enable_automatic_recalculation()
-                cr.set_current_cell_reference(self)
         # there is no need to recalculate table, as all derivations are cleared with this operation
         if any_changed:
             self.fire_events(self, EventType.OnNewValue, o)
@@ -824,6 +849,12 @@ class Table(TableCellsElement):
         :return:
         """
         global _THREAD_LOCAL_TABLE_STORAGE
+        # the map is private to this thread, so an existing entry can be read without the table lock
+        current_cell_map = getattr(_THREAD_LOCAL_TABLE_STORAGE, "_current_cell_map", None)
+        if current_cell_map is not None:
+            cr = current_cell_map.get(self)
+            if cr is not None:
+                return cast(_CellReference, cr)
         with self.lock:
             try:
                 return cast(_CellReference, _THREAD_LOCAL_TABLE_STORAGE._current_cell_map[self])
@@ -831,7 +862,7 @@ class Table(TableCellsElement):
                 with Table.table_class_lock():
                     _THREAD_LOCAL_TABLE_STORAGE._current_cell_map = WeakKeyDictionary[Table, _CellReference]()
                 _THREAD_LOCAL_TABLE_STORAGE._current_cell_map[self] = _CellReference()
-                return _THREAD_LOCAL_TABLE_STORAGE._current_cell_map[self]
+                return cast(_CellReference, _THREAD_LOCAL_TABLE_STORAGE._current_cell_map[self])
             except KeyError:
                 _THREAD_LOCAL_TABLE_STORAGE._current_cell_map[self] = _CellReference()
                 return cast(_CellReference, _THREAD_LOCAL_TABLE_STORAGE._current_cell_map[self])
@@ -890,7 +921,11 @@ class Table(TableCellsElement):
     @property
     def _current_cell_stack(self) -> deque[_CellReference]:
         global _THREAD_LOCAL_TABLE_STORAGE
-        stack_map = None
+        stack_map = getattr(_THREAD_LOCAL_TABLE_STORAGE, "_current_cell_stack", None)
+        if stack_map is not None:
+            stack = stack_map.get(self)
+            if stack is not None:
+                return cast(deque[_CellReference], stack)
         with self.lock:
             try:
                 return cast(deque[_CellReference], _THREAD_LOCAL_TABLE_STORAGE._current_cell_stack[self])
@@ -898,7 +933,7 @@ class Table(TableCellsElement):
                 with Table.table_class_lock():
                     _THREAD_LOCAL_TABLE_STORAGE._current_cell_stack = WeakKeyDictionary[Table, deque[_CellReference]]()
                 _THREAD_LOCAL_TABLE_STORAGE._current_cell_stack[self] = deque[_CellReference]()
-                return _THREAD_LOCAL_TABLE_STORAGE._current_cell_stack[self]
+                return cast(deque[_CellReference], _THREAD_LOCAL_TABLE_STORAGE._current_cell_stack[self])
             except KeyError:
                 _THREAD_LOCAL_TABLE_STORAGE._current_cell_stack[self] = deque[_CellReference]()
                 return cast(deque[_CellReference], _THREAD_LOCAL_TABLE_STORAGE._current_cell_stack[self])
@@ -960,7 +995,7 @@ class Table(TableCellsElement):
                 or (et == ElementType.Column and self.is_column_labels_indexed)
             ):
                 key = str(md).strip().lower()
-                target = self._element_label_indexes[et].get(key, None) if key else None  # type: ignore
+                target = self._label_index_for(et).get(key, None) if key else None  # type: ignore
             else:
                 target = cast(TableSliceElement, self._find(slices, access.associated_property, str(md)))
             return int(target.index) - 1 if target else -1
@@ -1143,6 +1178,27 @@ class Table(TableCellsElement):
                 pass
                 # TODO: fire onCreate event
 
+    def _append_slices(self, tes: Sequence[Row] | Sequence[Column]) -> None:
+        """
+        Appends the given Rows or Columns, all of the same type, to the end of this table under a
+        single lock acquisition; as nothing is shifted, no existing slices need to be re-indexed
+        """
+        from . import TableSliceElement
+
+        if not tes:
+            return
+        with self.lock:
+            slices = cast(
+                ArrayList[TableSliceElement], self._rows if tes[0].element_type == ElementType.Row else self._columns
+            )
+            slices.ensure_capacity(len(slices) + len(tes))
+            for te in tes:
+                te.vet_element(allow_uninitialized=True)
+                slices.append(te)
+                te._set_index(len(slices))
+                te._mark_initialized()
+            tes[-1].mark_current()
+
     def add_row(self, a1: int | Access | None = None, *args: object) -> Row:
         return self._add_slice_dispatch(ElementType.Row, a1, *args)  # type: ignore[return-value]
 
@@ -116,7 +116,7 @@ class TableCellsElement(TableElement, ABC):
 
     @property
     def properties(self) -> Collection[Property]:
-        return sorted(list(self.element_type.properties()))
+        return self.element_type.properties()
 
     @property
     def is_pendings(self) -> bool:
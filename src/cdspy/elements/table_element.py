@@ -98,7 +98,7 @@ class TableElement(BaseElement, ABC):
     @BaseElement.label.setter  # type: ignore[attr-defined]
     def label(self, value: Optional[str]) -> None:
         if self.is_label_indexed:
-            label_index = self.table._element_label_indexes[self.element_type]
+            label_index = self.table._label_index_for(self.element_type)
             with self.table.lock:
                 cur_label_key = self.label.strip().lower() if self.label else None
                 value_key = value.strip().lower() if value else None
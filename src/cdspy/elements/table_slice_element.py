@@ -53,12 +53,12 @@ class TableSliceElement(TableCellsElement, Derivable, Groupable, ABC, Generic[T]
         pass
 
     @staticmethod
-    def _reindex_slice(elems: ArrayList[T]) -> None:
-        index = 1
-        for elem in elems:
+    def _reindex_slice(elems: ArrayList[T], start: int = 0) -> None:
+        # slice indices are 1-based positions, so they can be reassigned without reading the old values
+        for offset in range(start, len(elems)):
+            elem = elems[offset]
             if elem is not None:
-                elem._set_index(index)
-            index += 1
+                elem._set_index(offset + 1)
 
     def __init__(self, te: Optional[TableElement] = None) -> None:
         super().__init__(te)
@@ -107,9 +107,7 @@ class TableSliceElement(TableCellsElement, Derivable, Groupable, ABC, Generic[T]
             elems[index] = cast(T, self)
         else:  # insert the new column into the cols array and reindex those pushed forward
             elems.insert(index, cast(T, self))
-            for e in elems[index + 1 :]:
-                if e:
-                    e._set_index(e.index + 1)
+            self._reindex_slice(elems, index + 1)
 
         self._mark_initialized()
         self.mark_current()
@@ -4,8 +4,9 @@ import pytest
 
 from ...test_base import TestBase
 
-from cdspy.elements import Table, Group
+from cdspy.elements import Table, Group, TableContext
 from cdspy.elements.filters import FilteredTable
+from cdspy.exceptions import ReadOnlyException, UnsupportedException
 
 
 class TestFilterTable(TestBase):
@@ -29,9 +30,56 @@ class TestFilterTable(TestBase):
         assert ft.num_rows == 50
 
         assert ft.parent == t
+        assert [c.index for c in ft.columns] == [1, 2]
+        assert [r.index for r in ft.rows] == list(range(1, 51))
+        assert ft.current_column == ft.get_column(2)
+        assert ft.current_row == ft.get_row(50)
         cell_cnt = 0
         for cell in ft.cells:
             assert cell
             assert cell.value == 34
             cell_cnt += 1
         assert cell_cnt == ft.num_rows * ft.num_columns
+
+    def test_filtered_elements_are_read_only(self) -> None:
+        t = Table()
+        c1 = t.add_column()
+        t.add_column()
+        t.add_row(5)
+        t.fill(34)
+
+        ft = FilteredTable.create_table(t, Group(t, None, c1))
+        fc = ft.get_column(1)
+        fr = ft.get_row(1)
+        assert fc and fr
+
+        with pytest.raises(UnsupportedException, match="Can not fill a filtered Column"):
+            fc.fill(42)
+        with pytest.raises(UnsupportedException, match="Can not clear a filtered Column"):
+            fc.clear()
+        with pytest.raises(UnsupportedException, match="Can not fill a filtered Row"):
+            fr.fill(42)
+        with pytest.raises(UnsupportedException, match="Can not clear a filtered Row"):
+            fr.clear()
+
+        cell = ft.get_cell(fr, fc)
+        assert cell
+        assert cell.value == 34
+        assert ft.get_cell(fr, fc) is cell
+        with pytest.raises(ReadOnlyException, match="ReadOnly: Cell->CellValue"):
+            cell.fill(42)
+        with pytest.raises(ReadOnlyException, match="ReadOnly: Cell->CellValue"):
+            cell.clear()
+        with pytest.raises(UnsupportedException, match="Can not delete a filtered cell"):
+            cell.delete()
+        assert t.get_cell(t.get_row(1), c1).value == 34
+
+    def test_filter_table_context(self) -> None:
+        tc = TableContext.create_context(TableContext())
+        t = Table(parent_context=tc)
+        c1 = t.add_column()
+        t.add_row(5)
+
+        ft = FilteredTable.create_table(t, Group(t, None, c1))
+        assert ft.table_context == tc
+        assert ft.table_context != TableContext()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from threading import Thread
+from typing import List, Optional
+
+from ...test_base import TestBase
+
+from cdspy.elements import Table, Row
+
+
+# noinspection PyMethodMayBeStatic
+class TestCurrentCell(TestBase):
+    def test_current_cell_is_per_thread(self) -> None:
+        t = Table(4, 4)
+        r1 = t.add_row()
+        r2 = t.add_row()
+        t.add_column()
+
+        t.current_row = r1
+        assert t.current_row == r1
+        assert t._current_cell is t._current_cell
+
+        seen: List[Optional[Row]] = []
+
+        def other_thread() -> None:
+            seen.append(t.current_row)
+            t.current_row = r2
+            seen.append(t.current_row)
+
+        th = Thread(target=other_thread)
+        th.start()
+        th.join()
+
+        # the other thread started with no current row, and its change is not visible here
+        assert seen == [None, r2]
+        assert t.current_row == r1
+
+    def test_current_cell_stack(self) -> None:
+        t = Table(4, 4)
+        r1 = t.add_row()
+        r2 = t.add_row()
+        t.add_column()
+
+        t.current_row = r1
+        t.push_current_cell()
+        t.current_row = r2
+        assert t.current_row == r2
+        t.pop_current_cell()
+        assert t.current_row == r1
+
+    def test_new_thread_starts_without_current_cell(self) -> None:
+        t = Table(4, 4)
+        r1 = t.add_row()
+        t.add_column()
+
+        seen: List[Optional[Row]] = []
+
+        def set_current() -> None:
+            seen.append(t.current_row)
+            t.current_row = r1
+
+        # threads run one after another, so CPython is free to reuse the finished thread's ident
+        for _ in range(20):
+            th = Thread(target=set_current)
+            th.start()
+            th.join()
+        assert seen == [None] * 20
+
+    def test_delete_clears_current_cell(self) -> None:
+        t = Table(4, 4)
+        r1 = t.add_row()
+        t.add_column()
+        t.current_row = r1
+        assert t.current_row == r1
+
+        t.delete()
+        assert t.is_invalid
+        assert t.current_row is None
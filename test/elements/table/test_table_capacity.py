@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from ...test_base import TestBase
+
+from cdspy.elements import Table, Property
+
+
+# noinspection PyMethodMayBeStatic
+class TestTableCapacity(TestBase):
+    def test_capacity_increments(self) -> None:
+        t = Table(10, 20)
+        assert t.row_capacity_incr == t.get_property(Property.RowCapacityIncr)
+        assert t.column_capacity_incr == t.get_property(Property.ColumnCapacityIncr)
+
+        t.row_capacity_incr = 7
+        t.column_capacity_incr = 5
+        assert t.row_capacity_incr == t.get_property(Property.RowCapacityIncr) == 7
+        assert t.column_capacity_incr == t.get_property(Property.ColumnCapacityIncr) == 5
+
+        # capacities round up to whole increments, and are never less than one increment
+        assert [t._calculate_rows_capacity(n) for n in (-1, 0, 1, 7, 8, 14, 15)] == [7, 7, 7, 7, 14, 14, 21]
+        assert [t._calculate_columns_capacity(n) for n in (0, 5, 6)] == [5, 5, 10]
+
+    def test_initial_storage(self) -> None:
+        t = Table(300, 10)
+        # initial storage is reserved in whole capacity increments
+        assert t._rows.capacity == t.rows_capacity == t._calculate_rows_capacity(300)
+        assert t._columns.capacity == t.columns_capacity == t._calculate_columns_capacity(10)
+        assert t._rows.capacity % t.row_capacity_incr == 0
+        assert t._columns.capacity % t.column_capacity_incr == 0
+
+    def test_capacity_increments_by_name(self) -> None:
+        t = Table(10, 20)
+        t.set_property("RowCapacityIncr", 9)
+        t.set_property("columnCapacityIncr", 3)
+        assert t.get_property("RowCapacityIncr") == t.get_property(Property.RowCapacityIncr) == 9
+        assert t.row_capacity_incr == 9
+        assert t.column_capacity_incr == t.get_property(Property.ColumnCapacityIncr) == 3
+
+        # new columns size their cell storage from the refreshed increment
+        c = t.add_column()
+        assert c._cells.capacity_increment == 9
+
+        # clearing the property falls back to the context default
+        t._clear_property(Property.RowCapacityIncr)
+        assert t.row_capacity_incr == t.table_context.row_capacity_incr_default
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from ...test_base import TestBase
+
+from cdspy.elements import Table, Group
+from cdspy.elements.table import _TableCellIterator
+
+
+# noinspection PyMethodMayBeStatic
+class TestTableCells(TestBase):
+    def test_table_cells(self) -> None:
+        t = Table(4, 4)
+        assert t.is_null
+        r1 = t.add_row()
+        r2 = t.add_row()
+        c1 = t.add_column()
+        c2 = t.add_column()
+        c3 = t.add_column()
+        assert (t.is_null, t.num_cells) == (True, 0)
+
+        # only one cell exists before iterating
+        t.get_cell(r2, c2).value = 42
+        assert (t.is_null, t.num_cells) == (False, 1)
+
+        # cells are returned column by column, creating any that are sparse
+        cells = list(t.cells)
+        assert len(cells) == t.num_rows * t.num_columns == 6
+        assert [(c.row, c.column) for c in cells] == [
+            (r1, c1),
+            (r2, c1),
+            (r1, c2),
+            (r2, c2),
+            (r1, c3),
+            (r2, c3),
+        ]
+        assert cells[3].value == 42
+        assert t.num_cells == 6
+
+        # existing cells are returned as-is on the next pass
+        assert list(t.cells) == cells
+
+        # has_next peeks ahead without consuming a cell
+        it = t.cells
+        assert isinstance(it, _TableCellIterator)
+        assert it.has_next and it.has_next
+        assert [next(it) for _ in range(5)] == cells[:5]
+        assert it.has_next
+        assert next(it) is cells[5]
+        assert not it.has_next
+
+    def test_cell_state_is_held_on_cell(self) -> None:
+        t = Table(4, 4)
+        r1 = t.add_row()
+        c1 = t.add_column()
+        cell = t.get_cell(r1, c1)
+        g = Group(t)
+
+        cell.set_property("Universal Answer", 42)
+        assert cell.get_property("Universal Answer") == 42
+        assert (cell._props or {}).get("universal answer") == 42
+
+        g.add(cell)
+        assert cell.num_groups == 1
+        assert list(cell.groups) == [g]
+        g.remove(cell)
+        assert cell.num_groups == 0
+        assert not cell.groups
+
+        # deleting the cell releases its properties and group memberships
+        g.add(cell)
+        cell._delete()
+        assert cell.is_invalid
+        assert cell.num_groups == 0
+        assert cell.derivation is None
+        assert cell._props is None
+
+    def test_delete_table(self) -> None:
+        t = Table(4, 4)
+        rows = [t.add_row() for _ in range(3)]
+        cols = [t.add_column() for _ in range(3)]
+        t.fill(7)
+        cells = list(t.cells)
+        assert len(cells) == 9
+
+        t.delete()
+        assert t.is_invalid
+        assert t.num_rows == 0
+        assert t.num_columns == 0
+        assert all(r.is_invalid for r in rows)
+        assert all(c.is_invalid for c in cols)
+        assert all(c.is_invalid for c in cells)
+
+    def test_row_by_cell_offset(self) -> None:
+        t = Table(4, 4)
+        r1 = t.add_row()
+        r2 = t.add_row()
+        c1 = t.add_column()
+        cell = t.get_cell(r2, c1)
+        assert cell.row == r2
+        assert t._row_by_cell_offset(r2._cell_offset) == r2
+        assert r1._cell_offset < 0
+        assert t._row_by_cell_offset(r1._cell_offset) is None
+        assert t._row_by_cell_offset(r2._cell_offset + 1) is None
+
+    def test_table_fill(self) -> None:
+        t = Table(4, 4)
+        t.add_row()
+        t.add_row()
+        c3 = t.add_column(3)
+        assert list(t._columns) == [None, None, c3]
+
+        # filling the table creates the sparse columns and fills every cell
+        t.fill(5)
+        assert t.num_columns == 3
+        assert all(c is not None for c in t._columns)
+        assert t.num_cells == 6
+        assert all(cell.value == 5 for cell in t.cells)
+
+        # and leaves the current cell where it was
+        c1 = t.get_column(1)
+        t.current_column = c1
+        t.fill(6)
+        assert t.current_column == c1
+        assert t.get_cell(t.get_row(2), c3).value == 6
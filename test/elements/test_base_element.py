@@ -229,3 +229,33 @@ def test_get_property() -> None:
     # fail if key is not a string or property
     with pytest.raises(InvalidPropertyException, match=f"Invalid Property: {type(42)}"):
         assert tc.get_property(42) == 42  # type: ignore
+
+
+def test_implements() -> None:
+    for et in ElementType:
+        be = MockBaseElement(et)
+        assert not be._implements(None)
+        for p in Property:
+            assert p.is_implemented_by(be) == p.is_implemented_by(et)
+            assert be._implements(p) == p.is_implemented_by(et)
+
+
+def test_state_flags() -> None:
+    tc = MockBaseElement()
+    assert type(tc._state) is int
+    assert (tc.is_valid, tc.is_invalid, tc.is_dirty) == (True, False, False)
+
+    tc._mark_dirty()
+    tc._set(BaseElementState.READONLY_FLAG)
+    assert type(tc._state) is int
+    assert tc._state == BaseElementState.IS_DIRTY_FLAG | BaseElementState.READONLY_FLAG
+    assert (tc.is_dirty, tc.is_read_only) == (True, True)
+
+    tc._mutate_state(BaseElementState.READONLY_FLAG, False)
+    tc._mark_clean()
+    assert type(tc._state) is int
+    assert tc._state == BaseElementState.NO_FLAGS_SET
+    assert (tc.is_dirty, tc.is_read_only) == (False, False)
+
+    tc._invalidate()
+    assert (tc.is_valid, tc.is_invalid) == (False, True)
@@ -60,8 +60,10 @@ class TestColumns(TestBase):
         assert c4.index == 4
 
         # try to reindex columns; should fail
-        with pytest.raises(KeyError):
+        with pytest.raises(KeyError, match="Column Label 'Unique Label 2' not unique"):
             t.is_column_labels_indexed = True
+        assert not t.is_column_labels_indexed
+        assert not t._col_label_index
 
         # clear dup label and retry; should succeed
         c3.label = None
@@ -228,6 +230,19 @@ class TestColumns(TestBase):
         assert t.num_columns == 0
         assert g.num_columns == 0
 
+        # batch deletes skip repeats and elements from other tables
+        c3 = t.add_column()
+        c4 = t.add_column()
+        c5 = t.add_column()
+        other = Table()
+        oc = other.add_column()
+        t.delete(c3, c3, oc, c5)
+        assert c3.is_invalid
+        assert c5.is_invalid
+        assert oc.is_valid
+        assert c4.index == 1
+        assert t.num_columns == 1
+
     def test_column_fill(self) -> None:
         t = Table(10, 10)
         assert t
@@ -257,6 +272,7 @@ class TestColumns(TestBase):
 
         r1.fill(64)
         assert t.num_cells == 16
+        assert r1.num_cells == 16
         for idx in range(1, 17):
             assert t.get_cell_value(r1, t.get_column(idx)) == 64
 
@@ -322,6 +338,21 @@ class TestColumns(TestBase):
         assert len(c1._cells._list) % t.column_capacity_incr == 0
         assert c1.capacity % t.column_capacity_incr == 0
 
+        # looking up a sparse cell without creating it leaves the row untouched
+        r_new = t.add_row()
+        assert r_new._get_cell(c1, True, False) is None
+        assert r_new.num_cells == 0
+        assert r_new.get_cell(c1) is not None
+        assert r_new.num_cells == 1
+
+        # deleting a column, or a cell, drops it from the row's count
+        r2 = t.get_row(2)
+        assert r2.num_cells == t.num_columns == 16
+        t.get_column(16).delete()
+        assert r2.num_cells == 15
+        t.get_cell(r2, t.get_column(1))._delete()
+        assert r2.num_cells == 14
+
     def test_column_iterable(self) -> None:
         t = Table(10, 10)
         assert t
@@ -6,6 +6,8 @@ import pytest
 
 from cdspy.elements import ElementType
 from cdspy.elements import Property
+from cdspy.elements import Access
+from cdspy.elements import TimeUnit
 
 
 def test_element_type_basic() -> None:
@@ -181,3 +183,35 @@ def test_property_flags() -> None:
             assert p.is_initializable_property
         else:
             assert not p.is_initializable_property
+
+
+def test_property_types() -> None:
+    for p in Property:
+        assert p.is_boolean_property == p.name.startswith("Is")
+    assert Property.Precision.is_numeric_property
+    assert Property.NumPendingCorePoolThreads.is_numeric_property
+    assert not Property.Label.is_numeric_property
+    assert Property.Label.is_string_property
+    assert Property.DisplayFormat.is_string_property
+    assert not Property.Precision.is_string_property
+
+
+def test_time_unit_seconds() -> None:
+    for tu in TimeUnit:
+        assert isinstance(tu.value, int)
+    assert TimeUnit.MIN.seconds == 60
+    assert TimeUnit.SEC.seconds == 1
+    assert TimeUnit.MSEC.seconds * 1000 == 1
+    assert TimeUnit.USEC.seconds * 1000000 == 1
+
+
+def test_access_by_name() -> None:
+    for a in Access:
+        assert Access(a.name) is a
+        assert Access(f" {a.name.upper()} ") is a
+        assert Access(a.value) is a
+
+    with pytest.raises(ValueError, match="'unknown' is not a valid Access"):
+        Access("Unknown")
+    with pytest.raises(ValueError, match="None is not a valid Access"):
+        Access(None)
@@ -7,6 +7,7 @@ import re
 from ..test_base import TestBase
 
 from cdspy.elements import Table, Group, Access, Property
+from cdspy.computation import Derivation
 from cdspy.exceptions import InvalidParentException
 
 
@@ -176,9 +177,14 @@ class TestGroups(TestBase):
         with pytest.raises(InvalidParentException):
             g.add(rt2)
 
+        # sorted rows are reused until the group changes
+        assert list(g.rows) == [r1, r2, r3]
+        assert g.rows is g.rows
+
         # remove rows individually
         g.remove(r1)
         assert g.num_rows == 2
+        assert list(g.rows) == [r2, r3]
 
         g.remove(r2, r3)
         assert g.num_rows == 0
@@ -436,6 +442,67 @@ class TestGroups(TestBase):
         assert c1.is_invalid
         assert g.num_cells == 2
 
+    def test_nested_group_cell_counts(self) -> None:
+        t = Table(10, 10)
+        r1 = t.add_row(1)
+        r2 = t.add_row(2)
+        c1 = t.add_column(1)
+        c2 = t.add_column(2)
+
+        child = Group(t, None, r1)
+        parent = Group(t, None, child)
+        assert child.num_cells == 2
+        assert parent.num_cells == 2
+
+        # adding a cell patches the child's index in place and refreshes its parent
+        child.add(t.get_cell(r2, c1))
+        assert not child.is_dirty
+        assert child.num_cells == 3
+        assert parent.num_cells == 3
+
+        # adding a cell already covered by a row is a no-op
+        assert not child.add(t.get_cell(r1, c2))
+        assert child.num_cells == 3
+
+        child.add(r2)
+        assert child.num_cells == 4
+        assert parent.num_cells == 4
+
+        child.remove(r1)
+        assert child.num_cells == 2
+        assert parent.num_cells == 2
+
+        # removing an explicitly added cell clears it from the index in place
+        cell = t.get_cell(r1, c1)
+        child.add(cell)
+        assert child.num_cells == 3
+        child.remove(cell)
+        assert not child.is_dirty
+        assert child.num_cells == 2
+        assert parent.num_cells == 2
+
+    def test_derived_elements(self) -> None:
+        t = Table(10, 10)
+        r1 = t.add_row(1)
+        c1 = t.add_column(1)
+        c2 = t.add_column(2)
+        cell1 = t.get_cell(r1, c1)
+        cell2 = t.get_cell(r1, c2)
+
+        child = Group(t, None, cell1, cell2)
+        parent = Group(t, None, child)
+        assert not child.derived_elements
+        assert not parent.derived_elements
+
+        # registering a derivation resets the cached results of every enclosing group
+        t._register_cell_derivation(cell2, Derivation())
+        assert list(child.derived_elements) == [cell2]
+        assert list(parent.derived_elements) == [cell2]
+
+        child.remove(cell2)
+        assert not child.derived_elements
+        assert not parent.derived_elements
+
     def test_copy_group(self) -> None:
         t = Table(1000, 1000)
         r1 = t.add_row(1)
@@ -455,8 +522,10 @@ class TestGroups(TestBase):
         # make a copy
         g1 = g.copy()
         assert g1
+        assert not g1.is_dirty
         assert len(g1) == len(g)
         assert g1.equal(g)
+        assert g1 in c2.groups
 
         for r in g.rows:
             assert r in g1
@@ -835,6 +904,28 @@ class TestGroups(TestBase):
         assert not g1.is_disjoint(g2)
         assert g1.similarity(g2) == 2.0 / 4.0
 
+    def test_group_jaccard_index(self) -> None:
+        t = Table(200, 2)
+        r1 = t.add_row(1)
+        r200 = t.add_row(200)
+        c1 = t.add_column()
+        t.add_column()
+
+        # empty groups have nothing in common
+        assert t.add_group().jaccard_index(t.add_group()) == 0.0
+        assert t.add_group().similarity(t.add_group(c1)) == 0.0
+
+        # index is the ratio of the intersection and union cardinalities
+        g1 = t.add_group(r1, r200)
+        g2 = t.add_group(c1)
+        assert (len(g1), len(g2), len(g1 & g2), len(g1 | g2)) == (4, t.num_rows, 2, t.num_rows + 2)
+        assert g1.jaccard_index(g2) == g2.jaccard_index(g1) == 2.0 / (t.num_rows + 2)
+        assert g1.jaccard_index(t.add_group(r1, r200)) == 1.0
+
+        # groups from different tables have nothing in common
+        t2 = Table(200, 2)
+        assert g1.jaccard_index(t2.add_group(t2.add_row(1))) == 0.0
+
     def test_get_group(self) -> None:
         t1 = Table()
         t1.is_group_labels_indexed = True